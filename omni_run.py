@@ -29,6 +29,7 @@ from dataclasses import dataclass, asdict, field
 from enum import Enum
 import re
 import argparse
+import functools
 import hashlib
 
 # Optional imports
@@ -52,6 +53,36 @@ try:
 except ImportError:
     WATCHDOG_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Default entry-point file name prefixes; each runner fuses its own copy into one regex
+_MAIN_FILE_PATTERNS = [
+    r'^main\.', r'^app\.', r'^index\.', r'^start\.', r'^run\.',
+    r'^launcher\.', r'^entry\.', r'^__main__\.', r'^server\.', r'^cli\.',
+    r'^manage\.', r'^wsgi\.', r'^asgi\.'
+]
+
+# Makefile targets and justfile recipes
+_TASK_TARGET_RE = re.compile(r'^([a-zA-Z0-9_-]+):')
+
+_VERSION_RE = re.compile(r'(\d+\.\d+(?:\.\d+)?)')
+
+# PATH lookups are cached per (name, PATH) since the scan asks for the same few
+# interpreters for every program; OmniRun.reset_scan_caches() clears the cache
+# at the end of each scan, so it only lasts until then
+@functools.lru_cache(maxsize=None)
+def _which_on_path(name: str, path: Optional[str]) -> Optional[str]:
+    return shutil.which(name, path=path)
+
+
+def _which(name: str) -> Optional[str]:
+    """Locate an executable, resolving each name once per PATH value until the next scan ends."""
+    return _which_on_path(name, os.environ.get('PATH'))
+
 # Color codes for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -153,7 +184,15 @@ class OmniRun:
         self.system = platform.system()
         self.verbose = verbose
         self.discovered_programs: List[ExecutableProgram] = []
+        self.programs_by_name: Dict[str, ExecutableProgram] = {}
+        self.programs_by_framework: Dict[str, ExecutableProgram] = {}
         self.execution_history: List[ExecutionResult] = []
+        self._interpreter_versions: Dict[str, str] = {}
+        # Directory listings shared by every lookup within one scan; None outside a scan
+        self._directory_listings: Optional[Dict[Path, Dict[str, os.DirEntry]]] = None
+        self._parsed_json: Optional[Dict[Path, Any]] = None
+        # Default filesystems on Windows and macOS match file names case-insensitively
+        self._case_insensitive_fs = self.system in ('Windows', 'Darwin')
         self.config = self._load_config(config_file)
         
         # Disable colors on Windows unless in a compatible terminal
@@ -326,11 +365,19 @@ class OmniRun:
             }
         }
         
-        self.main_file_patterns = [
-            r'^main\.', r'^app\.', r'^index\.', r'^start\.', r'^run\.',
-            r'^launcher\.', r'^entry\.', r'^__main__\.', r'^server\.', r'^cli\.',
-            r'^manage\.', r'^wsgi\.', r'^asgi\.'
-        ]
+        self.main_file_patterns = list(_MAIN_FILE_PATTERNS)
+        self._main_file_re = None
+        self._main_file_re_source: Tuple[str, ...] = ()
+    
+    def _main_file_regex(self) -> 're.Pattern':
+        """Return main_file_patterns fused into one regex, recompiled only when the list changes."""
+        patterns = tuple(self.main_file_patterns)
+        if self._main_file_re is None or patterns != self._main_file_re_source:
+            # (?!) never matches, so an emptied list scores no file as a main file
+            source = '|'.join(f'(?:{pattern})' for pattern in patterns) or '(?!)'
+            self._main_file_re = re.compile(source)
+            self._main_file_re_source = patterns
+        return self._main_file_re
     
     def _load_config(self, config_file: Optional[str]) -> Dict[str, Any]:
         """Load configuration from file."""
@@ -390,16 +437,68 @@ class OmniRun:
             }.get(level, "")
             print(f"{color}[{timestamp}] [{level}] {message}{Colors.ENDC}")
     
+    def _entry_key(self, name: str) -> str:
+        """Key a directory entry the way the filesystem compares names."""
+        return name.casefold() if self._case_insensitive_fs else name
+    
+    def _list_directory(self, path: Path) -> Dict[str, os.DirEntry]:
+        """List a directory once so marker lookups are dict hits instead of stat calls."""
+        if self._directory_listings is not None and path in self._directory_listings:
+            return self._directory_listings[path]
+        
+        try:
+            with os.scandir(path) as it:
+                entries = {self._entry_key(entry.name): entry for entry in it}
+        except OSError:
+            entries = {}
+        
+        if self._directory_listings is not None:
+            self._directory_listings[path] = entries
+        return entries
+    
+    def _find_entry(self, entries: Dict[str, os.DirEntry], *names: str) -> Optional[os.DirEntry]:
+        """Return the entry for the first of names in a _list_directory() listing, or None."""
+        for name in names:
+            entry = entries.get(self._entry_key(name))
+            if entry is not None:
+                return entry
+        return None
+    
+    def _is_under_base_path(self, path: Path) -> bool:
+        """Whether path is base_path or below it, i.e. listed during a scan."""
+        return path == self.base_path or self.base_path in path.parents
+    
+    def _load_json(self, path: Path) -> Any:
+        """Parse a JSON file, reusing the parsed data for the rest of the current scan.
+        
+        Callers must treat the returned data as read-only.
+        """
+        if self._parsed_json is not None and path in self._parsed_json:
+            return self._parsed_json[path]
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        if self._parsed_json is not None:
+            self._parsed_json[path] = data
+        return data
+    
+    def reset_scan_caches(self):
+        """Drop directory listings, parsed files, PATH lookups and interpreter versions cached during a scan."""
+        self._directory_listings = None
+        self._parsed_json = None
+        self._interpreter_versions.clear()
+        _which_on_path.cache_clear()
+    
     def detect_environment(self, path: Path) -> Optional[Environment]:
         """Detect virtual environments, conda environments, or Docker with enhanced container support."""
-        # Check for Python venv/virtualenv
-        venv_paths = [
-            path / 'venv', path / 'env', path / '.venv',
-            path / 'virtualenv', path / '.env'
-        ]
+        entries = self._list_directory(path)
         
-        for venv_path in venv_paths:
-            if venv_path.exists():
+        # Check for Python venv/virtualenv
+        for venv_name in ('venv', 'env', '.venv', 'virtualenv', '.env'):
+            entry = self._find_entry(entries, venv_name)
+            if entry is not None and entry.is_dir():
+                venv_path = path / entry.name
                 python_exe = venv_path / 'bin' / 'python' if self.system != 'Windows' else venv_path / 'Scripts' / 'python.exe'
                 if python_exe.exists():
                     try:
@@ -421,8 +520,9 @@ class OmniRun:
                         pass
         
         # Check for conda environment
-        conda_env = path / 'environment.yml'
-        if conda_env.exists():
+        conda_entry = self._find_entry(entries, 'environment.yml')
+        if conda_entry is not None:
+            conda_env = path / conda_entry.name
             return Environment(
                 type='conda',
                 path=path,
@@ -431,52 +531,58 @@ class OmniRun:
             )
         
         # Enhanced Docker detection
-        dockerfile = path / 'Dockerfile'
-        docker_compose = path / 'docker-compose.yml' or path / 'docker-compose.yaml'
+        compose_entry = self._find_entry(entries, 'docker-compose.yml', 'docker-compose.yaml')
         
-        if docker_compose.exists():
+        if compose_entry is not None:
             return Environment(
                 type='docker-compose',
-                path=docker_compose,
+                path=path / compose_entry.name,
                 active=False,
                 activation_command=f"docker-compose up"
             )
-        elif dockerfile.exists() and self.config.get('enable_docker', True):
-            return Environment(
-                type='docker',
-                path=dockerfile,
-                active=False,
-                activation_command=f"docker build -t app {path} && docker run app"
-            )
+        elif self.config.get('enable_docker', True):
+            dockerfile_entry = self._find_entry(entries, 'Dockerfile')
+            if dockerfile_entry is not None:
+                return Environment(
+                    type='docker',
+                    path=path / dockerfile_entry.name,
+                    active=False,
+                    activation_command=f"docker build -t app {path} && docker run app"
+                )
         
         return None
     
     def detect_task_runners(self, path: Path) -> List[TaskRunner]:
         """Detect task runners like Makefile, Justfile, etc."""
         runners = []
+        entries = self._list_directory(path)
         
         # Makefile
-        makefile = path / 'Makefile'
-        if makefile.exists():
+        make_entry = self._find_entry(entries, 'Makefile')
+        if make_entry is not None:
+            makefile = path / make_entry.name
             tasks = self._parse_makefile(makefile)
             runners.append(TaskRunner(type='make', file=makefile, tasks=tasks))
         
         # Justfile
-        justfile = path / 'justfile' or path / 'Justfile'
-        if justfile.exists():
+        just_entry = self._find_entry(entries, 'justfile', 'Justfile')
+        if just_entry is not None:
+            justfile = path / just_entry.name
             tasks = self._parse_justfile(justfile)
             runners.append(TaskRunner(type='just', file=justfile, tasks=tasks))
         
         # package.json scripts
-        package_json = path / 'package.json'
-        if package_json.exists():
+        package_entry = self._find_entry(entries, 'package.json')
+        if package_entry is not None:
+            package_json = path / package_entry.name
             tasks = self._parse_package_json_scripts(package_json)
             if tasks:
                 runners.append(TaskRunner(type='npm', file=package_json, tasks=tasks))
         
         # Taskfile.yml
-        taskfile = path / 'Taskfile.yml'
-        if taskfile.exists():
+        taskfile_entry = self._find_entry(entries, 'Taskfile.yml')
+        if taskfile_entry is not None:
+            taskfile = path / taskfile_entry.name
             tasks = self._parse_taskfile(taskfile)
             runners.append(TaskRunner(type='task', file=taskfile, tasks=tasks))
         
@@ -490,7 +596,7 @@ class OmniRun:
                 lines = f.readlines()
                 for i, line in enumerate(lines):
                     # Match targets (lines that start with word followed by :)
-                    match = re.match(r'^([a-zA-Z0-9_-]+):', line)
+                    match = _TASK_TARGET_RE.match(line)
                     if match and not match.group(1).startswith('.'):
                         task_name = match.group(1)
                         # Look for comment on the same line or next line
@@ -512,7 +618,7 @@ class OmniRun:
             with open(justfile, 'r') as f:
                 for line in f:
                     # Match recipes (similar to Makefile)
-                    match = re.match(r'^([a-zA-Z0-9_-]+):', line)
+                    match = _TASK_TARGET_RE.match(line)
                     if match:
                         tasks.append(match.group(1))
         except:
@@ -522,9 +628,8 @@ class OmniRun:
     def _parse_package_json_scripts(self, package_json: Path) -> List[str]:
         """Parse package.json to extract npm scripts."""
         try:
-            with open(package_json, 'r') as f:
-                data = json.load(f)
-                return list(data.get('scripts', {}).keys())
+            data = self._load_json(package_json)
+            return list(data.get('scripts', {}).keys())
         except:
             return []
     
@@ -589,72 +694,74 @@ class OmniRun:
             """Find package.json by searching up the directory tree."""
             current = search_path
             while current != current.parent:  # Stop at root
-                package_json = current / 'package.json'
-                if package_json.exists():
-                    return package_json
+                if self._is_under_base_path(current):
+                    has_package_json = self._find_entry(self._list_directory(current), 'package.json') is not None
+                else:
+                    has_package_json = (current / 'package.json').exists()
+                if has_package_json:
+                    return current / 'package.json'
                 current = current.parent
             return None
         
         package_json_path = find_package_json(path)
         if package_json_path:
             try:
-                with open(package_json_path, 'r') as f:
-                    data = json.load(f)
-                    deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                    
-                    if 'next' in deps:
-                        return Framework(
-                            name='Next.js',
-                            version=deps.get('next'),
-                            commands={
-                                'dev': 'npm run dev',
-                                'build': 'npm run build',
-                                'start': 'npm start',
-                                'export': 'npm run export'
-                            }
-                        )
-                    elif 'react' in deps:
-                        return Framework(
-                            name='React',
-                            version=deps.get('react'),
-                            commands={'start': 'npm start', 'build': 'npm run build', 'test': 'npm test'}
-                        )
-                    elif 'vue' in deps:
-                        return Framework(
-                            name='Vue.js',
-                            version=deps.get('vue'),
-                            commands={'serve': 'npm run serve', 'build': 'npm run build'}
-                        )
-                    elif 'angular' in deps.get('dependencies', {}):
-                        return Framework(
-                            name='Angular',
-                            version=deps.get('dependencies', {}).get('@angular/core'),
-                            commands={'serve': 'ng serve', 'build': 'ng build', 'test': 'ng test'}
-                        )
-                    elif 'svelte' in deps:
-                        return Framework(
-                            name='Svelte',
-                            version=deps.get('svelte'),
-                            commands={'dev': 'npm run dev', 'build': 'npm run build'}
-                        )
-                    elif 'nuxt' in deps:
-                        return Framework(
-                            name='Nuxt.js',
-                            version=deps.get('nuxt'),
-                            commands={'dev': 'npm run dev', 'build': 'npm run build', 'generate': 'npm run generate'}
-                        )
-                    elif 'express' in deps:
-                        return Framework(
-                            name='Express.js',
-                            version=deps.get('express'),
-                            commands={'start': 'npm start', 'dev': 'npm run dev'}
-                        )
-                    elif 'nest' in deps.get('dependencies', {}):
-                        return Framework(
-                            name='NestJS',
-                            version=deps.get('dependencies', {}).get('@nestjs/core'),
-                            commands={'start': 'npm run start', 'build': 'npm run build', 'test': 'npm run test'}
-                        )
+                data = self._load_json(package_json_path)
+                deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
+                
+                if 'next' in deps:
+                    return Framework(
+                        name='Next.js',
+                        version=deps.get('next'),
+                        commands={
+                            'dev': 'npm run dev',
+                            'build': 'npm run build',
+                            'start': 'npm start',
+                            'export': 'npm run export'
+                        }
+                    )
+                elif 'react' in deps:
+                    return Framework(
+                        name='React',
+                        version=deps.get('react'),
+                        commands={'start': 'npm start', 'build': 'npm run build', 'test': 'npm test'}
+                    )
+                elif 'vue' in deps:
+                    return Framework(
+                        name='Vue.js',
+                        version=deps.get('vue'),
+                        commands={'serve': 'npm run serve', 'build': 'npm run build'}
+                    )
+                elif 'angular' in deps.get('dependencies', {}):
+                    return Framework(
+                        name='Angular',
+                        version=deps.get('dependencies', {}).get('@angular/core'),
+                        commands={'serve': 'ng serve', 'build': 'ng build', 'test': 'ng test'}
+                    )
+                elif 'svelte' in deps:
+                    return Framework(
+                        name='Svelte',
+                        version=deps.get('svelte'),
+                        commands={'dev': 'npm run dev', 'build': 'npm run build'}
+                    )
+                elif 'nuxt' in deps:
+                    return Framework(
+                        name='Nuxt.js',
+                        version=deps.get('nuxt'),
+                        commands={'dev': 'npm run dev', 'build': 'npm run build', 'generate': 'npm run generate'}
+                    )
+                elif 'express' in deps:
+                    return Framework(
+                        name='Express.js',
+                        version=deps.get('express'),
+                        commands={'start': 'npm start', 'dev': 'npm run dev'}
+                    )
+                elif 'nest' in deps.get('dependencies', {}):
+                    return Framework(
+                        name='NestJS',
+                        version=deps.get('dependencies', {}).get('@nestjs/core'),
+                        commands={'start': 'npm run start', 'build': 'npm run build', 'test': 'npm run test'}
+                    )
             except:
                 pass
         
@@ -1092,7 +1199,7 @@ class OmniRun:
         try:
             # Build command
             if prog.type == 'Python':
-                cmd = ['python3' if shutil.which('python3') else 'python', str(prog.path)]
+                cmd = ['python3' if _which('python3') else 'python', str(prog.path)]
             elif prog.type == 'JavaScript':
                 cmd = ['node', str(prog.path)]
             elif prog.type == 'TypeScript':
@@ -1243,8 +1350,7 @@ class OmniRun:
     def _check_package_json_with_fix(self, config_path: Path, dependencies: List[DependencyCheck], work_dir: Path):
         """Check Node.js dependencies with auto-fix support."""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                package_data = json.load(f)
+            package_data = self._load_json(config_path)
             
             deps = package_data.get('dependencies', {})
             dev_deps = package_data.get('devDependencies', {})
@@ -1294,7 +1400,7 @@ class OmniRun:
                 
                 if not venv_exists and self.config.get('enable_venv', True):
                     # Suggest creating venv
-                    python_cmd = 'python3' if shutil.which('python3') else 'python'
+                    python_cmd = 'python3' if _which('python3') else 'python'
                     dependencies.append(DependencyCheck(
                         name="Python virtual environment",
                         required=False,
@@ -1386,32 +1492,39 @@ class OmniRun:
     def check_interpreter_available(self, interpreter: str) -> Tuple[bool, Optional[str]]:
         """Check if an interpreter/runtime is available and get its version."""
         try:
-            exe_path = shutil.which(interpreter)
+            exe_path = _which(interpreter)
             if not exe_path:
                 return False, None
             
-            version_flags = ['--version', '-version', '-v']
-            for flag in version_flags:
-                try:
-                    result = subprocess.run(
-                        [interpreter, flag],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    if result.returncode == 0:
-                        version_output = result.stdout or result.stderr
-                        version_match = re.search(r'(\d+\.\d+(?:\.\d+)?)', version_output)
-                        if version_match:
-                            return True, version_match.group(1)
-                        return True, version_output.split('\n')[0][:50]
-                except:
-                    continue
-            
-            return True, "unknown"
+            # Probe each executable once; every program of a type shares its interpreter
+            if exe_path not in self._interpreter_versions:
+                self._interpreter_versions[exe_path] = self._probe_interpreter_version(interpreter)
+            return True, self._interpreter_versions[exe_path]
         except Exception as e:
             return False, None
     
+    def _probe_interpreter_version(self, interpreter: str) -> str:
+        """Run an interpreter's version flag and extract its version string."""
+        version_flags = ['--version', '-version', '-v']
+        for flag in version_flags:
+            try:
+                result = subprocess.run(
+                    [interpreter, flag],
+                    capture_output=True,
+                    text=True,
+                    timeout=5
+                )
+                if result.returncode == 0:
+                    version_output = result.stdout or result.stderr
+                    version_match = _VERSION_RE.search(version_output)
+                    if version_match:
+                        return version_match.group(1)
+                    return version_output.split('\n')[0][:50]
+            except:
+                continue
+        
+        return "unknown"
+    
     def scan_for_executables(self, max_depth: int = None) -> List[ExecutableProgram]:
         """Scan for executables with enhanced detection."""
         if max_depth is None:
@@ -1422,80 +1535,101 @@ class OmniRun:
         
         self.log(f"Starting enhanced scan of {self.base_path}", "INFO")
         
+        type_by_extension: Dict[str, str] = {}
+        for prog_type, config in self.executable_patterns.items():
+            for extension in config['extensions']:
+                type_by_extension.setdefault(extension, prog_type)
+        
         def scan_directory(path: Path, current_depth: int = 0):
             nonlocal scanned_files
             
             if current_depth > max_depth:
                 return
             
+            # List the directory once; environment, task runner and config lookups reuse it
+            try:
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except PermissionError:
+                self.log(f"Permission denied: {path}", "WARNING")
+                return
+            except OSError as e:
+                self.log(f"Error scanning {path}: {e}", "ERROR")
+                return
+            self._directory_listings[path] = {self._entry_key(entry.name): entry for entry in entries}
+            
             # Detect environment at directory level
             environment = self.detect_environment(path)
             task_runners = self.detect_task_runners(path)
             
             try:
-                for item in path.iterdir():
-                    if item.is_file():
+                # DirEntry carries the file type from readdir, so no per-item stat is needed
+                for entry in entries:
+                    item = Path(entry.path)
+                    if entry.is_file():
                         scanned_files += 1
                         
-                        for prog_type, config in self.executable_patterns.items():
-                            extensions = config['extensions']
-                            
+                        # One lookup classifies the file; the first type listing an extension wins
+                        if item.suffix:
+                            prog_type = type_by_extension.get(item.suffix.lower())
+                        elif 'Executable' in self.executable_patterns:
+                            prog_type = 'Executable'
+                        else:
+                            prog_type = None
+                        if prog_type == 'Executable' and not os.access(item, os.X_OK) and self.system != 'Windows':
+                            prog_type = None
+                        
+                        if prog_type is not None:
                             detected_type = prog_type
                             
                             # Special handling for files without extensions
                             if not item.suffix:
-                                if prog_type == 'Executable':
-                                    # For executable files without extension, check if they're actually scripts
-                                    try:
-                                        with open(item, 'r', encoding='utf-8', errors='ignore') as f:
-                                            first_line = f.readline().strip()
-                                            if first_line.startswith('#!/usr/bin/env php') or first_line.startswith('#!/usr/bin/php'):
-                                                detected_type = 'PHP'
-                                            elif first_line.startswith('#!/usr/bin/env ruby') or first_line.startswith('#!/usr/bin/ruby'):
-                                                detected_type = 'Ruby'
-                                            elif first_line.startswith('#!/usr/bin/env python') or first_line.startswith('#!/usr/bin/python'):
-                                                detected_type = 'Python'
-                                            elif first_line.startswith('#!/usr/bin/env node') or first_line.startswith('#!/usr/bin/node'):
-                                                detected_type = 'JavaScript'
-                                    except:
-                                        pass
+                                # For executable files without extension, check if they're actually scripts
+                                try:
+                                    with open(item, 'r', encoding='utf-8', errors='ignore') as f:
+                                        first_line = f.readline().strip()
+                                        if first_line.startswith('#!/usr/bin/env php') or first_line.startswith('#!/usr/bin/php'):
+                                            detected_type = 'PHP'
+                                        elif first_line.startswith('#!/usr/bin/env ruby') or first_line.startswith('#!/usr/bin/ruby'):
+                                            detected_type = 'Ruby'
+                                        elif first_line.startswith('#!/usr/bin/env python') or first_line.startswith('#!/usr/bin/python'):
+                                            detected_type = 'Python'
+                                        elif first_line.startswith('#!/usr/bin/env node') or first_line.startswith('#!/usr/bin/node'):
+                                            detected_type = 'JavaScript'
+                                except:
+                                    pass
+                            
+                            # Use detected type for processing
+                            actual_type = detected_type
                             
-                            if item.suffix.lower() in extensions or (not item.suffix and prog_type == 'Executable'):
-                                if prog_type == 'Executable' and not os.access(item, os.X_OK) and self.system != 'Windows':
-                                    continue
-                                
-                                # Use detected type for processing
-                                actual_type = detected_type if not item.suffix and prog_type == 'Executable' else prog_type
-                                
-                                self.log(f"Analyzing {item.name}", "INFO")
-                                
-                                dependencies = self.check_dependencies(item, actual_type)
-                                
-                                score = self.is_likely_main_file(item)
-                                config_files = self.get_config_files(item, actual_type)
-                                complexity = self.estimate_complexity(item)
-                                framework = self.detect_framework(item.parent, actual_type)
-                                
-                                executable = ExecutableProgram(
-                                    path=item,
-                                    name=item.name,
-                                    relative_path=str(item.relative_to(self.base_path)),
-                                    type=actual_type,
-                                    interpreters=self.executable_patterns.get(actual_type, {}).get('interpreters', []),
-                                    score=score,
-                                    dependencies=dependencies,
-                                    has_config=len(config_files) > 0,
-                                    config_files=config_files,
-                                    estimated_complexity=complexity,
-                                    environment=environment,
-                                    framework=framework,
-                                    task_runners=task_runners
-                                )
-                                
-                                executables.append(executable)
-                                break
+                            self.log(f"Analyzing {item.name}", "INFO")
+                            
+                            dependencies = self.check_dependencies(item, actual_type)
+                            
+                            score = self.is_likely_main_file(item)
+                            config_files = self.get_config_files(item, actual_type)
+                            complexity = self.estimate_complexity(item)
+                            framework = self.detect_framework(item.parent, actual_type)
+                            
+                            executable = ExecutableProgram(
+                                path=item,
+                                name=item.name,
+                                relative_path=str(item.relative_to(self.base_path)),
+                                type=actual_type,
+                                interpreters=self.executable_patterns.get(actual_type, {}).get('interpreters', []),
+                                score=score,
+                                dependencies=dependencies,
+                                has_config=len(config_files) > 0,
+                                config_files=config_files,
+                                estimated_complexity=complexity,
+                                environment=environment,
+                                framework=framework,
+                                task_runners=task_runners
+                            )
+                            
+                            executables.append(executable)
                     
-                    elif item.is_dir() and not item.name.startswith('.'):
+                    elif entry.is_dir() and not item.name.startswith('.'):
                         if item.name not in self.config.get('exclude_dirs', []):
                             scan_directory(item, current_depth + 1)
             
@@ -1504,10 +1638,27 @@ class OmniRun:
             except Exception as e:
                 self.log(f"Error scanning {path}: {e}", "ERROR")
         
-        scan_directory(self.base_path)
+        # Each directory (and each ancestor probed for config files) is listed once per
+        # scan, and each package.json parsed once; the caches are dropped afterwards so
+        # a rescan sees files added or edited since
+        self._directory_listings = {}
+        self._parsed_json = {}
+        try:
+            scan_directory(self.base_path)
+        finally:
+            self.reset_scan_caches()
         executables.sort(key=lambda x: x.score, reverse=True)
         self.discovered_programs = executables
         
+        # Index by file name and framework; on a clash the highest-scoring program wins,
+        # as with a list search
+        self.programs_by_name = {}
+        self.programs_by_framework = {}
+        for prog in executables:
+            self.programs_by_name.setdefault(prog.name, prog)
+            if prog.framework:
+                self.programs_by_framework.setdefault(prog.framework.name, prog)
+        
         self.log(f"Scan complete. {scanned_files} files scanned, {len(executables)} programs found", "SUCCESS")
         return executables
     
@@ -1537,10 +1688,8 @@ class OmniRun:
             if filename_lower in files:
                 score += 50  # Framework main files get highest score
         
-        for pattern in self.main_file_patterns:
-            if re.match(pattern, filepath.name.lower()):
-                score += 15
-                break
+        if self._main_file_regex().match(filename_lower):
+            score += 15
         
         for main_name in ['main', 'app', 'index', 'start', 'run', 'manage', 'server', 'cli', 'entry']:
             if main_name in name_lower:
@@ -1593,24 +1742,22 @@ class OmniRun:
     
     def get_config_files(self, filepath: Path, prog_type: str) -> List[str]:
         """Find configuration files related to the program."""
-        config_files = []
         config = self.executable_patterns.get(prog_type, {})
+        wanted = config.get('config_files', [])
+        found = set()
+        
+        # Search up the directory tree, stopping early once every config name is found
+        current = filepath.parent
+        while current != current.parent and len(found) < len(wanted):  # Stop at root
+            missing = [name for name in wanted if name not in found]
+            if self._is_under_base_path(current):
+                entries = self._list_directory(current)
+                found.update(name for name in missing if self._find_entry(entries, name) is not None)
+            else:
+                found.update(name for name in missing if (current / name).exists())
+            current = current.parent
         
-        def find_config_file(search_path: Path, config_file: str) -> bool:
-            """Find config file by searching up the directory tree."""
-            current = search_path
-            while current != current.parent:  # Stop at root
-                config_path = current / config_file
-                if config_path.exists():
-                    return True
-                current = current.parent
-            return False
-        
-        for config_file in config.get('config_files', []):
-            if find_config_file(filepath.parent, config_file):
-                config_files.append(config_file)
-        
-        return config_files
+        return [name for name in wanted if name in found]
     
     def estimate_complexity(self, filepath: Path) -> str:
         """Estimate program complexity."""
@@ -1715,8 +1862,8 @@ class OmniRun:
         else:
             return self.execute_program_synchronously(prog, args)
     
-    def generate_html_report(self, output_file: str):
-        """Generate beautiful HTML report with Tailwind CSS and interactivity."""
+    def render_html_report(self) -> str:
+        """Render the HTML report for the discovered programs without writing it."""
         ready_count = sum(1 for prog in self.discovered_programs if not any(d.required and not d.available for d in prog.dependencies))
         issues_count = len(self.discovered_programs) - ready_count
         
@@ -1967,11 +2114,18 @@ class OmniRun:
     </script>
 </body>
 </html>"""
+        return html
+    
+    def generate_html_report(self, output_file: str):
+        """Generate beautiful HTML report with Tailwind CSS and interactivity."""
+        html = self.render_html_report()
         
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            f.write(html)
+        # Encode once and write in one call; a write larger than the buffer goes
+        # straight to the file rather than through it in buffer-sized pieces
+        with open(output_file, 'wb') as f:
+            f.write(html.encode('utf-8'))
         
         print(f"{Colors.OKGREEN}[SUCCESS] Beautiful HTML report saved to: {output_file}{Colors.ENDC}")
         print(f"{Colors.OKCYAN}[INFO] Tip: Open in browser and click [COPY] buttons to copy commands{Colors.ENDC}")
@@ -2033,8 +2187,8 @@ class OmniRun:
         else:
             print(f"{Colors.OKCYAN}No environment activation needed - all programs ready to run!{Colors.ENDC}")
     
-    def generate_json_report(self, output_file):
-        """Generate JSON report for tooling integration."""
+    def build_json_report(self) -> Dict[str, Any]:
+        """Build the JSON report for the discovered programs as a dict without writing it."""
         report = {
             'project': str(self.base_path),
             'generated_at': datetime.now().isoformat(),
@@ -2083,10 +2237,28 @@ class OmniRun:
             
             report['programs'].append(prog_data)
         
+        return report
+    
+    def generate_json_report(self, output_file):
+        """Generate JSON report for tooling integration."""
+        report = self.build_json_report()
+        
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Serialize straight to UTF-8 bytes; orjson is optional and much faster
+        payload = None
+        if ORJSON_AVAILABLE:
+            try:
+                payload = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+            except TypeError:
+                # orjson rejects strings that are not valid UTF-8, such as file
+                # names the OS could only decode with surrogateescape
+                payload = None
+        if payload is None:
+            payload = (json.dumps(report, indent=2) + '\n').encode('utf-8')
+        
+        with open(output_file, 'wb') as f:
+            f.write(payload)
         
         print(f"{Colors.OKGREEN}JSON report saved to: {output_file}{Colors.ENDC}")
     
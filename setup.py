@@ -48,6 +48,8 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
+            "pytest-xdist>=3.0.0",
+            "orjson>=3.0.0",
             "black>=22.0.0",
             "flake8>=4.0.0",
             "mypy>=0.950",
@@ -55,8 +57,12 @@ setup(
         "watch": [
             "watchdog>=2.1.0",
         ],
+        "fast": [
+            "orjson>=3.0.0",
+        ],
         "all": [
             "watchdog>=2.1.0",
+            "orjson>=3.0.0",
         ],
     },
     entry_points={
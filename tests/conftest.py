@@ -6,11 +6,12 @@ These fixtures provide test environments for all test categories.
 
 import os
 import sys
+import copy
 import json
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Generator, Dict, Any, List
+from typing import Generator, Dict, Any, List, Tuple
 import pytest
 
 # Add parent directory to path for imports
@@ -28,11 +29,148 @@ def temp_dir() -> Generator[Path, None, None]:
         yield Path(tmpdir)
 
 
-@pytest.fixture
-def omni_runner(temp_dir) -> 'OmniRun':
-    """Create an OmniRun instance with temp directory."""
+@pytest.fixture(scope="session")
+def _session_runner() -> Dict[str, Any]:
+    """Construct one OmniRun per session and remember its pristine state."""
     # Import here to avoid module-level issues
     from omni_run import OmniRun
+    runner = OmniRun(".", verbose=True)
+    return {
+        'runner': runner,
+        'attributes': set(vars(runner)),
+        'config': copy.deepcopy(runner.config),
+    }
+
+
+@pytest.fixture
+def omni_runner(temp_dir, _session_runner) -> 'OmniRun':
+    """Reset the session OmniRun instance onto this test's temp directory."""
+    runner = _session_runner['runner']
+    
+    # Drop per-run attributes (e.g. auto-fix backup info) set after construction
+    for attr in set(vars(runner)) - _session_runner['attributes']:
+        delattr(runner, attr)
+    
+    runner.base_path = temp_dir.resolve()
+    runner.verbose = True
+    runner.discovered_programs.clear()
+    runner.programs_by_name.clear()
+    runner.programs_by_framework.clear()
+    runner.execution_history.clear()
+    runner.reset_scan_caches()
+    runner.config = copy.deepcopy(_session_runner['config'])
+    runner.preferred_commands = runner.config['preferred_commands']
+    return runner
+
+
+# The scan cache is a plain module global, so each pytest-xdist worker process
+# keeps its own copy and workers never share state. Only scan_cached() reads or
+# writes it; callers get copies and must never mutate the cached entries.
+_scan_cache: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+
+
+def scan_cached(runner: 'OmniRun') -> List[Any]:
+    """Scan runner.base_path, reusing an earlier scan of the same tree and scan settings.
+    
+    Only use this for session-built trees that are never modified (e.g. from
+    shared_project()); edits to a tree are not detected. Each call hands the
+    runner its own copies of the programs, so tests may mutate them freely.
+    """
+    key = (
+        str(runner.base_path),
+        runner.config.get('max_depth', 10),
+        tuple(runner.config.get('exclude_dirs', [])),
+        runner._case_insensitive_fs,
+    )
+    if key not in _scan_cache:
+        runner.scan_for_executables()
+        _scan_cache[key] = copy.deepcopy((
+            runner.discovered_programs,
+            runner.programs_by_name,
+            runner.programs_by_framework,
+        ))
+    # One deepcopy of all three keeps the indexes pointing at the copied programs
+    programs, programs_by_name, programs_by_framework = copy.deepcopy(_scan_cache[key])
+    runner.discovered_programs = programs
+    runner.programs_by_name = programs_by_name
+    runner.programs_by_framework = programs_by_framework
+    return runner.discovered_programs
+
+
+def read_and_assert(path: Path) -> bytes:
+    """Read a written file through one descriptor, asserting it exists and is non-empty.
+    
+    Replaces an exists() check followed by a read, which stats the file twice.
+    """
+    fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        assert size > 0, f"{path} is empty"
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture
+def scanned_programs(omni_runner):
+    """Return a function that scans a project root through the shared scan cache."""
+    def scan(root: Path = None) -> List[Any]:
+        if root is not None:
+            omni_runner.base_path = root.resolve()
+        return scan_cached(omni_runner)
+    return scan
+
+
+@pytest.fixture(scope="session")
+def shared_python_script_dir(tmp_path_factory) -> Path:
+    """Create a read-only single-script project shared across the session."""
+    project_dir = tmp_path_factory.mktemp("shared_python_script")
+    (project_dir / "hello.py").write_text('print("Hello, World!")')
+    return project_dir
+
+
+@pytest.fixture
+def simple_script_runner(omni_runner, shared_python_script_dir) -> 'OmniRun':
+    """Point the runner at the shared single-script project and scan it."""
+    omni_runner.base_path = shared_python_script_dir.resolve()
+    scan_cached(omni_runner)
+    return omni_runner
+
+
+_project_builders: Dict[str, Any] = {}
+
+
+def project_fixture(builder):
+    """Expose a project builder as a fixture and register it for shared_project().
+    
+    The builder writes its project into the directory passed as ``temp_dir``.
+    """
+    _project_builders[builder.__name__] = builder
+    return pytest.fixture(builder)
+
+
+@pytest.fixture(scope="session")
+def shared_project(tmp_path_factory):
+    """Return a function that builds a registered project once per session.
+    
+    The shared trees must be treated as read-only; tests that modify a project
+    should request its function-scoped fixture instead.
+    """
+    roots: Dict[str, Path] = {}
+    
+    def build(name: str) -> Path:
+        if name not in roots:
+            root = tmp_path_factory.mktemp(name)
+            _project_builders[name](root)
+            roots[name] = root
+        return roots[name]
+    return build
+
+
+@pytest.fixture
+def isolated_omni_runner(temp_dir) -> 'OmniRun':
+    """Create a dedicated OmniRun instance for tests that reconfigure it."""
+    from omni_run import OmniRun
     return OmniRun(str(temp_dir), verbose=True)
 
 
@@ -56,7 +194,7 @@ exclude_dirs: []
 # Python Project Fixtures
 # ============================================================================
 
-@pytest.fixture
+@project_fixture
 def python_simple_script(temp_dir) -> Path:
     """Create a simple Python script."""
     script = temp_dir / "hello.py"
@@ -81,7 +219,7 @@ if __name__ == "__main__":
     return script
 
 
-@pytest.fixture
+@project_fixture
 def python_flask_app(temp_dir) -> Path:
     """Create a Flask application."""
     app_file = temp_dir / "app.py"
@@ -102,7 +240,7 @@ if __name__ == "__main__":
     return app_file
 
 
-@pytest.fixture
+@project_fixture
 def python_django_app(temp_dir) -> Path:
     """Create a Django-like project structure."""
     # Create manage.py
@@ -125,7 +263,7 @@ if __name__ == "__main__":
     return manage_py
 
 
-@pytest.fixture
+@project_fixture
 def python_fastapi_app(temp_dir) -> Path:
     """Create a FastAPI application."""
     app_file = temp_dir / "main.py"
@@ -180,7 +318,7 @@ print(f"Python: {sys.version}")
 # JavaScript/TypeScript Project Fixtures
 # ============================================================================
 
-@pytest.fixture
+@project_fixture
 def nodejs_simple_script(temp_dir) -> Path:
     """Create a simple Node.js script."""
     script = temp_dir / "server.js"
@@ -196,7 +334,7 @@ server.listen(3000);
     return script
 
 
-@pytest.fixture
+@project_fixture
 def nodejs_express_app(temp_dir) -> Path:
     """Create an Express.js application."""
     # Create package.json
@@ -233,7 +371,7 @@ app.listen(3000);
     return app_file
 
 
-@pytest.fixture
+@project_fixture
 def nodejs_react_app(temp_dir) -> Path:
     """Create a React application."""
     # Create package.json
@@ -270,7 +408,7 @@ ReactDOM.render(<App />, document.getElementById("root"));
     return package_json
 
 
-@pytest.fixture
+@project_fixture
 def nodejs_nextjs_app(temp_dir) -> Path:
     """Create a Next.js application."""
     # Create package.json
@@ -340,7 +478,7 @@ console.log("App with dependencies");
 # Go Project Fixtures
 # ============================================================================
 
-@pytest.fixture
+@project_fixture
 def go_simple_program(temp_dir) -> Path:
     """Create a simple Go program."""
     main_file = temp_dir / "main.go"
@@ -365,7 +503,7 @@ go 1.21
     return main_file
 
 
-@pytest.fixture
+@project_fixture
 def go_gin_app(temp_dir) -> Path:
     """Create a Gin framework application."""
     main_file = temp_dir / "main.go"
@@ -398,7 +536,7 @@ require github.com/gin-gonic/gin v1.9.0
     return main_file
 
 
-@pytest.fixture
+@project_fixture
 def go_echo_app(temp_dir) -> Path:
     """Create an Echo framework application."""
     main_file = temp_dir / "main.go"
@@ -468,7 +606,7 @@ edition = "2021"
     return main_file
 
 
-@pytest.fixture
+@project_fixture
 def rust_actix_app(temp_dir) -> Path:
     """Create an Actix web framework application."""
     main_file = temp_dir / "main.rs"
@@ -505,7 +643,7 @@ actix-web = "4.0"
     return main_file
 
 
-@pytest.fixture
+@project_fixture
 def rust_rocket_app(temp_dir) -> Path:
     """Create a Rocket web framework application."""
     main_file = temp_dir / "main.rs"
@@ -635,7 +773,7 @@ public class App {
     return pom_xml
 
 
-@pytest.fixture
+@project_fixture
 def java_spring_boot_app(temp_dir) -> Path:
     """Create a Spring Boot application."""
     # Create pom.xml
@@ -754,7 +892,7 @@ def ruby_simple_script(temp_dir) -> Path:
     return script
 
 
-@pytest.fixture
+@project_fixture
 def ruby_rails_app(temp_dir) -> Path:
     """Create a Ruby on Rails application."""
     # Create Gemfile
@@ -821,7 +959,7 @@ def php_simple_script(temp_dir) -> Path:
     return script
 
 
-@pytest.fixture
+@project_fixture
 def php_laravel_app(temp_dir) -> Path:
     """Create a Laravel application."""
     # Create composer.json
@@ -886,12 +1024,26 @@ int main() {
 # Task Runner Fixtures
 # ============================================================================
 
-@pytest.fixture
-def makefile_project(temp_dir) -> Path:
-    """Create a project with Makefile."""
-    # Create Makefile
-    makefile = temp_dir / "Makefile"
-    makefile.write_text('''
+def link_template(template: Path, dest: Path) -> Path:
+    """Hardlink a session-scoped template file into a per-test directory.
+    
+    Writing to the returned file in place also changes the template, so tests
+    that edit it must replace it (unlink, then write) instead.
+    """
+    try:
+        os.link(template, dest)
+    except OSError:
+        # Hardlinks cannot cross filesystems; fall back to a plain copy
+        shutil.copyfile(template, dest)
+    return dest
+
+
+@pytest.fixture(scope="session")
+def task_runner_templates(tmp_path_factory) -> Path:
+    """Write the task runner files shared by many tests once per session."""
+    template_dir = tmp_path_factory.mktemp("task_runner_templates")
+    
+    (template_dir / "Makefile").write_text('''
 .PHONY: all clean test run
 
 all: run
@@ -906,19 +1058,7 @@ clean:
 	rm -f *.pyc __pycache__
 ''')
     
-    # Create app.py
-    app_file = temp_dir / "app.py"
-    app_file.write_text('print("Hello from Makefile project")\n')
-    
-    return makefile
-
-
-@pytest.fixture
-def justfile_project(temp_dir) -> Path:
-    """Create a project with justfile."""
-    # Create justfile
-    justfile = temp_dir / "justfile"
-    justfile.write_text('''
+    (template_dir / "justfile").write_text('''
 default:
     @echo "Running default task"
 
@@ -932,21 +1072,7 @@ deploy:
     @echo "Deploying..."
 ''')
     
-    # Create app.py
-    app_file = temp_dir / "app.py"
-    app_file.write_text('print("Hello from justfile project")\n')
-    
-    return justfile
-
-
-@pytest.fixture
-def taskfile_project(temp_dir) -> Path:
-    """Create a project with Taskfile.yml."""
-    import yaml
-    
-    # Create Taskfile.yml
-    taskfile = temp_dir / "Taskfile.yml"
-    taskfile.write_text('''
+    (template_dir / "Taskfile.yml").write_text('''
 version: "3"
 
 tasks:
@@ -963,6 +1089,65 @@ tasks:
       - echo "Building..."
 ''')
     
+    # Variants for the task runner edge-case tests
+    (template_dir / "Makefile.phony").write_text('.PHONY: test\ntest:\n\techo "make test"\n')
+    
+    (template_dir / "package.json").write_text('{"scripts": {"test": "echo npm test"}}')
+    
+    (template_dir / "Makefile.commented").write_text('''# Build the application
+build:
+	echo "building"
+
+# Run tests
+test:
+	echo "testing"
+
+# Deploy the application
+deploy: # Deploy to production
+	echo "deploying"
+''')
+    
+    return template_dir
+
+
+@pytest.fixture
+def makefile_project(temp_dir, task_runner_templates) -> Path:
+    """Create a project with Makefile.
+    
+    The Makefile is hardlinked to a session-wide template; treat it as read-only.
+    """
+    makefile = link_template(task_runner_templates / "Makefile", temp_dir / "Makefile")
+    
+    # Create app.py
+    app_file = temp_dir / "app.py"
+    app_file.write_text('print("Hello from Makefile project")\n')
+    
+    return makefile
+
+
+@pytest.fixture
+def justfile_project(temp_dir, task_runner_templates) -> Path:
+    """Create a project with justfile.
+    
+    The justfile is hardlinked to a session-wide template; treat it as read-only.
+    """
+    justfile = link_template(task_runner_templates / "justfile", temp_dir / "justfile")
+    
+    # Create app.py
+    app_file = temp_dir / "app.py"
+    app_file.write_text('print("Hello from justfile project")\n')
+    
+    return justfile
+
+
+@pytest.fixture
+def taskfile_project(temp_dir, task_runner_templates) -> Path:
+    """Create a project with Taskfile.yml.
+    
+    The Taskfile.yml is hardlinked to a session-wide template; treat it as read-only.
+    """
+    taskfile = link_template(task_runner_templates / "Taskfile.yml", temp_dir / "Taskfile.yml")
+    
     # Create app.py
     app_file = temp_dir / "app.py"
     app_file.write_text('print("Hello from Taskfile project")\n')
@@ -1070,7 +1255,7 @@ dependencies:
 # Multi-language Project Fixtures
 # ============================================================================
 
-@pytest.fixture
+@project_fixture
 def multi_language_project(temp_dir) -> Path:
     """Create a project with multiple languages."""
     # Create Python file
@@ -1110,11 +1295,37 @@ func main() { fmt.Println("Go service") }
     return temp_dir
 
 
+@pytest.fixture(params=["python_simple_script", "nodejs_simple_script", "go_simple_program"])
+def simple_project(request) -> Path:
+    """Create each framework-free, environment-free single-file project in turn."""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture
+def mixed_project(temp_dir) -> Path:
+    """Create a venv-backed script alongside a Dockerized service."""
+    app_file = temp_dir / "app.py"
+    app_file.write_text('print("Hello from venv")\n')
+    
+    python_exe = temp_dir / "venv" / "bin" / "python"
+    python_exe.parent.mkdir(parents=True)
+    python_exe.write_text("#!/bin/bash\necho Python")
+    os.chmod(python_exe, 0o755)
+    
+    # The Dockerfile lives in its own directory so the venv doesn't shadow it
+    service_dir = temp_dir / "service"
+    service_dir.mkdir()
+    (service_dir / "Dockerfile").write_text('FROM python:3.12-slim\nCMD ["python", "worker.py"]\n')
+    (service_dir / "worker.py").write_text('print("Hello from Docker")\n')
+    
+    return temp_dir
+
+
 # ============================================================================
 # Edge Case Fixtures
 # ============================================================================
 
-@pytest.fixture
+@project_fixture
 def empty_directory(temp_dir) -> Path:
     """Create an empty directory."""
     return temp_dir
@@ -1241,6 +1452,19 @@ def mock_interpreter_check(monkeypatch):
     monkeypatch.setattr('omni_run.OmniRun.check_interpreter_available', mock_check)
 
 
+@pytest.fixture
+def mock_subprocess(monkeypatch):
+    """Replace omni_run's subprocess.run with a mock returning a CompletedProcess."""
+    import subprocess
+    from unittest.mock import MagicMock
+    
+    mock_run = MagicMock(return_value=subprocess.CompletedProcess(
+        args=['python', 'x.py'], returncode=0, stdout="", stderr=""
+    ))
+    monkeypatch.setattr('omni_run.subprocess.run', mock_run)
+    return mock_run
+
+
 @pytest.fixture
 def disable_venv_detection(monkeypatch):
     """Disable virtual environment detection."""
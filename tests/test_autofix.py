@@ -25,7 +25,7 @@ class TestAutoFixProposal:
         """Test that auto-fix proposal shows missing dependencies."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             missing_deps = [d for d in express_prog.dependencies if d.required and not d.available and d.can_auto_fix]
@@ -38,7 +38,7 @@ class TestAutoFixProposal:
         """Test that no auto-fix proposal when all deps available."""
         omni_runner.scan_for_executables()
         
-        prog = next(p for p in omni_runner.discovered_programs if p.name == "hello.py")
+        prog = omni_runner.programs_by_name["hello.py"]
         
         missing_deps = [d for d in prog.dependencies if d.required and not d.available and d.can_auto_fix]
         
@@ -49,7 +49,7 @@ class TestAutoFixProposal:
         """Test that auto-fix proposal shows fix commands."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             missing_deps = [d for d in express_prog.dependencies if d.required and not d.available and d.can_auto_fix]
@@ -67,7 +67,7 @@ class TestAutoFixExecution:
         """Test that auto_fix returns boolean."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             # Dry run - don't actually execute
@@ -79,7 +79,7 @@ class TestAutoFixExecution:
         """Test that dry-run mode doesn't make changes."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             # Do dry run
@@ -89,11 +89,12 @@ class TestAutoFixExecution:
             node_modules = omni_runner.base_path / "node_modules"
             assert not node_modules.exists()
     
+    @pytest.mark.integration
     def test_auto_fix_non_interactive(self, nodejs_express_app, omni_runner):
         """Test auto-fix in non-interactive mode."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             # Non-interactive mode - should not prompt
@@ -109,7 +110,7 @@ class TestAutoFixSafety:
         """Test that backup is created when enabled."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             # Create backup should be possible
@@ -121,7 +122,7 @@ class TestAutoFixSafety:
         """Test that rollback works on failure."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             # Create backup
@@ -184,7 +185,7 @@ class TestAutoFixPackageManagers:
         """Test npm install command generation."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             node_modules_dep = next((d for d in express_prog.dependencies if d.name == "node_modules"), None)
@@ -235,7 +236,7 @@ class TestAutoFixPython:
         """Test pip install command generation."""
         omni_runner.scan_for_executables()
         
-        flask_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Flask"), None)
+        flask_prog = omni_runner.programs_by_framework.get("Flask")
         
         if flask_prog:
             packages_dep = next((d for d in flask_prog.dependencies if d.name == "Python packages"), None)
@@ -248,7 +249,7 @@ class TestAutoFixPython:
         """Test venv creation command generation."""
         omni_runner.scan_for_executables()
         
-        flask_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Flask"), None)
+        flask_prog = omni_runner.programs_by_framework.get("Flask")
         
         if flask_prog:
             venv_dep = next((d for d in flask_prog.dependencies if d.name == "Python virtual environment"), None)
@@ -320,7 +321,7 @@ class TestAutoFixDisplay:
         """Test that fix command is stored in dependency."""
         omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in omni_runner.discovered_programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         if express_prog:
             node_modules_dep = next((d for d in express_prog.dependencies if d.name == "node_modules"), None)
@@ -337,7 +338,7 @@ class TestAutoFixEdgeCases:
         """Test that interpreter cannot be auto-fixed."""
         omni_runner.scan_for_executables()
         
-        prog = next(p for p in omni_runner.discovered_programs if p.name == "hello.py")
+        prog = omni_runner.programs_by_name["hello.py"]
         
         interp_deps = [d for d in prog.dependencies if d.name in ["python", "python3"]]
         
@@ -358,6 +359,7 @@ class TestAutoFixEdgeCases:
 class TestAutoFixExecutionResult:
     """Tests for auto-fix execution result handling."""
     
+    @pytest.mark.integration
     def test_execute_program_with_auto_fix(self, nodejs_express_app, omni_runner):
         """Test execute_program with auto_fix parameter."""
         omni_runner.scan_for_executables()
@@ -373,6 +375,7 @@ class TestAutoFixExecutionResult:
             # May fail if no interpreter available - that's OK
             pass
     
+    @pytest.mark.integration
     def test_execute_program_skips_auto_fix(self, python_simple_script, omni_runner):
         """Test execute_program without auto_fix when not needed."""
         omni_runner.scan_for_executables()
@@ -15,6 +15,7 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from conftest import *
+import omni_run
 
 
 class TestInterpreterAvailability:
@@ -63,6 +64,48 @@ class TestInterpreterAvailability:
         
         assert available is False
         assert version is None
+    
+    def test_version_probed_once_per_executable(self, omni_runner):
+        """Test that repeated checks reuse the first version probe."""
+        with patch('omni_run.subprocess.run', wraps=omni_run.subprocess.run) as mock_run:
+            first = omni_runner.check_interpreter_available("python3")
+            second = omni_runner.check_interpreter_available("python3")
+        
+        assert first == second
+        assert mock_run.call_count == 1
+    
+    def test_version_probed_again_after_scan(self, omni_runner):
+        """Test that a completed scan drops cached versions so upgrades are seen."""
+        with patch('omni_run.subprocess.run', wraps=omni_run.subprocess.run) as mock_run:
+            omni_runner.check_interpreter_available("python3")
+            omni_runner.scan_for_executables()
+            omni_runner.check_interpreter_available("python3")
+        
+        assert mock_run.call_count == 2
+    
+    def test_path_lookup_cached_per_path_value(self, omni_runner, monkeypatch):
+        """Test that PATH is searched once per interpreter until PATH changes."""
+        omni_run._which_on_path.cache_clear()
+        with patch('omni_run.shutil.which', wraps=omni_run.shutil.which) as mock_which:
+            omni_runner.check_interpreter_available("python3")
+            omni_runner.check_interpreter_available("python3")
+            assert mock_which.call_count == 1
+            
+            monkeypatch.setenv("PATH", os.environ["PATH"] + os.pathsep + str(omni_runner.base_path))
+            omni_runner.check_interpreter_available("python3")
+            assert mock_which.call_count == 2
+    
+    def test_missing_tool_found_after_scan(self, omni_runner, monkeypatch):
+        """Test that a tool installed after a failed lookup is found once a scan completes."""
+        tool = omni_runner.base_path / "omni_test_tool"
+        monkeypatch.setenv("PATH", str(omni_runner.base_path))
+        assert omni_run._which("omni_test_tool") is None
+        
+        tool.write_text("#!/bin/sh\n")
+        tool.chmod(0o755)
+        omni_runner.scan_for_executables()
+        
+        assert omni_run._which("omni_test_tool") == str(tool)
 
 
 class TestDependencyCheckClass:
@@ -109,9 +152,9 @@ class TestPythonDependencyChecking:
     
     def test_check_requirements_txt(self, python_flask_app, omni_runner):
         """Test checking requirements.txt."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        flask_prog = next((p for p in programs if p.framework and p.framework.name == "Flask"), None)
+        flask_prog = omni_runner.programs_by_framework.get("Flask")
         assert flask_prog is not None
         
         # Should have dependencies
@@ -125,9 +168,9 @@ class TestPythonDependencyChecking:
     
     def test_python_with_interpreter_available(self, python_simple_script, omni_runner):
         """Test that Python programs check interpreter availability."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        prog = next(p for p in programs if p.name == "hello.py")
+        prog = omni_runner.programs_by_name["hello.py"]
         
         # Should have interpreter dependency
         interp_deps = [d for d in prog.dependencies if d.name in ["python", "python3"]]
@@ -136,9 +179,9 @@ class TestPythonDependencyChecking:
     
     def test_python_config_files_detected(self, python_flask_app, omni_runner):
         """Test that Python config files are detected."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        prog = next((p for p in programs if p.framework and p.framework.name == "Flask"), None)
+        prog = omni_runner.programs_by_framework.get("Flask")
         
         assert prog.has_config is True
         assert "requirements.txt" in prog.config_files
@@ -149,9 +192,9 @@ class TestNodeDependencyChecking:
     
     def test_check_package_json(self, nodejs_express_app, omni_runner):
         """Test checking package.json."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         assert express_prog is not None
         
         deps = express_prog.dependencies
@@ -159,9 +202,9 @@ class TestNodeDependencyChecking:
     
     def test_node_modules_missing(self, nodejs_express_app, omni_runner):
         """Test that missing node_modules is detected."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         # node_modules should not exist in fixture
         node_modules_dep = next((d for d in express_prog.dependencies if d.name == "node_modules"), None)
@@ -181,9 +224,9 @@ class TestNodeDependencyChecking:
     
     def test_npm_scripts_as_tasks(self, nodejs_express_app, omni_runner):
         """Test that npm scripts are available as tasks."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         npm_runner = next((r for r in express_prog.task_runners if r.type == "npm"), None)
         assert npm_runner is not None
@@ -287,9 +330,9 @@ class TestMissingDependencies:
     
     def test_python_missing_deps(self, python_flask_app, omni_runner):
         """Test that missing Python dependencies are detected."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        flask_prog = next((p for p in programs if p.framework and p.framework.name == "Flask"), None)
+        flask_prog = omni_runner.programs_by_framework.get("Flask")
         
         missing = [d for d in flask_prog.dependencies if d.required and not d.available]
         
@@ -303,9 +346,9 @@ class TestMissingDependencies:
     
     def test_node_missing_deps(self, nodejs_express_app, omni_runner):
         """Test that missing Node dependencies are detected."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         missing = [d for d in express_prog.dependencies if d.required and not d.available]
         
@@ -322,9 +365,9 @@ class TestAutoFixCapability:
     
     def test_python_packages_auto_fixable(self, python_flask_app, omni_runner):
         """Test that Python packages are auto-fixable."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        flask_prog = next((p for p in programs if p.framework and p.framework.name == "Flask"), None)
+        flask_prog = omni_runner.programs_by_framework.get("Flask")
         
         # Find Python packages dependency
         packages_dep = next((d for d in flask_prog.dependencies if d.name == "Python packages"), None)
@@ -334,9 +377,9 @@ class TestAutoFixCapability:
     
     def test_venv_creation_auto_fixable(self, python_flask_app, omni_runner):
         """Test that venv creation is auto-fixable."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        flask_prog = next((p for p in programs if p.framework and p.framework.name == "Flask"), None)
+        flask_prog = omni_runner.programs_by_framework.get("Flask")
         
         # Find venv dependency
         venv_dep = next((d for d in flask_prog.dependencies if d.name == "Python virtual environment"), None)
@@ -346,9 +389,9 @@ class TestAutoFixCapability:
     
     def test_interpreter_not_auto_fixable(self, python_simple_script, omni_runner):
         """Test that interpreter is not auto-fixable."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        prog = next(p for p in programs if p.name == "hello.py")
+        prog = omni_runner.programs_by_name["hello.py"]
         
         # Find interpreter dependency
         interp_deps = [d for d in prog.dependencies if d.name in ["python", "python3"]]
@@ -361,9 +404,9 @@ class TestRequiredVsOptionalDependencies:
     
     def test_interpreter_required(self, python_simple_script, omni_runner):
         """Test that interpreter is marked as required."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        prog = next(p for p in programs if p.name == "hello.py")
+        prog = omni_runner.programs_by_name["hello.py"]
         
         interp_deps = [d for d in prog.dependencies if d.name in ["python", "python3"]]
         if interp_deps:
@@ -371,9 +414,9 @@ class TestRequiredVsOptionalDependencies:
     
     def test_config_file_optional(self, python_flask_app, omni_runner):
         """Test that config files may be marked as optional."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        flask_prog = next((p for p in programs if p.framework and p.framework.name == "Flask"), None)
+        flask_prog = omni_runner.programs_by_framework.get("Flask")
         
         # Find requirements.txt
         req_dep = next((d for d in flask_prog.dependencies if d.name == "requirements.txt"), None)
@@ -404,9 +447,9 @@ class TestDependencyMessages:
     
     def test_node_modules_message(self, nodejs_express_app, omni_runner):
         """Test node_modules check message."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         node_modules_dep = next((d for d in express_prog.dependencies if d.name == "node_modules"), None)
         if node_modules_dep:
@@ -418,9 +461,9 @@ class TestFixCommands:
     
     def test_npm_install_command(self, nodejs_express_app, omni_runner):
         """Test that npm install command is generated."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        express_prog = next((p for p in programs if p.framework and p.framework.name == "Express.js"), None)
+        express_prog = omni_runner.programs_by_framework.get("Express.js")
         
         node_modules_dep = next((d for d in express_prog.dependencies if d.name == "node_modules"), None)
         if node_modules_dep:
@@ -428,9 +471,9 @@ class TestFixCommands:
     
     def test_pip_install_command(self, python_flask_app, omni_runner):
         """Test that pip install command is generated."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        flask_prog = next((p for p in programs if p.framework and p.framework.name == "Flask"), None)
+        flask_prog = omni_runner.programs_by_framework.get("Flask")
         
         packages_dep = next((d for d in flask_prog.dependencies if d.name == "Python packages"), None)
         if packages_dep:
@@ -10,7 +10,9 @@ This module tests:
 """
 
 import os
+import json
 import pytest
+from collections import Counter
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -120,6 +122,15 @@ class TestLanguageIdentification:
         assert len(programs) == 1
         assert programs[0].type == "TypeScript"
     
+    def test_identify_uppercase_extension(self, temp_dir, omni_runner):
+        """Test that extensions are matched case-insensitively."""
+        (temp_dir / "Tool.PY").write_text('print("hello")\n')
+        (temp_dir / "notes.txt").write_text("not a program\n")
+        
+        programs = omni_runner.scan_for_executables()
+        assert len(programs) == 1
+        assert programs[0].type == "Python"
+    
     def test_identify_go(self, go_simple_program, omni_runner):
         """Test Go file identification."""
         programs = omni_runner.scan_for_executables()
@@ -178,6 +189,27 @@ class TestMainFileScoring:
         assert len(programs) == 1
         assert programs[0].score >= 15  # Should match main pattern
     
+    def test_main_file_regex_compiled_once(self, python_main_pattern, omni_runner):
+        """Test that repeated scoring reuses one compiled main file regex."""
+        omni_runner.is_likely_main_file(python_main_pattern)
+        compiled = omni_runner._main_file_re
+        
+        assert omni_runner.is_likely_main_file(python_main_pattern) >= 15
+        assert omni_runner._main_file_re is compiled
+    
+    def test_main_file_patterns_changes_honored(self, temp_dir, isolated_omni_runner):
+        """Test that edits to main_file_patterns change the score."""
+        script = temp_dir / "bootstrap.py"
+        script.write_text('print("bootstrap")\n')
+        before = isolated_omni_runner.is_likely_main_file(script)
+        
+        isolated_omni_runner.main_file_patterns.append(r'^bootstrap\.')
+        assert isolated_omni_runner.is_likely_main_file(script) == before + 15
+        
+        
+        isolated_omni_runner.main_file_patterns = [r'^main\.']
+        assert isolated_omni_runner.is_likely_main_file(script) == before
+    
     def test_app_py_high_score(self, temp_dir, omni_runner):
         """Test that app.py gets high score."""
         script = temp_dir / "app.py"
@@ -297,6 +329,44 @@ class TestDiscoveredProgramsStorage:
         
         # Should now have 2 programs
         assert len(omni_runner.discovered_programs) == 2
+    
+    def test_programs_indexed_by_name(self, multi_language_project, omni_runner):
+        """Test that every discovered program can be looked up by file name."""
+        omni_runner.scan_for_executables()
+        
+        for prog in omni_runner.discovered_programs:
+            assert omni_runner.programs_by_name[prog.name].score >= prog.score
+        assert set(omni_runner.programs_by_name) == {p.name for p in omni_runner.discovered_programs}
+    
+    def test_programs_indexed_by_framework(self, python_flask_app, omni_runner):
+        """Test that framework programs can be looked up by framework name."""
+        omni_runner.scan_for_executables()
+        
+        assert omni_runner.programs_by_framework["Flask"].name == "app.py"
+        assert all(p.framework for p in omni_runner.programs_by_framework.values())
+    
+    def test_config_lookup_does_not_list_ancestors(self, multi_language_project, omni_runner):
+        """Test that config lookups reuse the scan's listings and never list ancestors of base_path."""
+        ancestor = str(omni_runner.base_path.parent)
+        
+        with patch.object(omni_runner, '_list_directory', wraps=omni_runner._list_directory) as mock_list:
+            with patch('omni_run.os.scandir', wraps=os.scandir) as mock_scandir:
+                omni_runner.scan_for_executables()
+        
+        listed = Counter(str(call.args[0]) for call in mock_list.call_args_list)
+        scanned = Counter(str(call.args[0]) for call in mock_scandir.call_args_list)
+        assert len(omni_runner.discovered_programs) > 1
+        assert listed[str(omni_runner.base_path)] > 1
+        assert scanned[ancestor] == 0
+    
+    def test_package_json_parsed_once_per_scan(self, nodejs_nextjs_app, omni_runner):
+        """Test that task, framework and dependency checks share one package.json parse."""
+        with patch('omni_run.json.load', wraps=json.load) as mock_load:
+            omni_runner.scan_for_executables()
+        
+        parsed = Counter(call.args[0].name for call in mock_load.call_args_list)
+        assert omni_runner.programs_by_framework.get("Next.js") is not None
+        assert parsed[str(omni_runner.base_path / "package.json")] == 1
 
 
 class TestScannedFilesCounter:
@@ -326,7 +396,7 @@ class TestPermissionHandling:
         
         try:
             # Should not raise exception
-            programs = omni_runner.scan_for_executables()
+            omni_runner.scan_for_executables()
             # File might be skipped due to permission error
         finally:
             # Restore permissions for cleanup
@@ -425,8 +495,8 @@ class TestRelativePathCalculation:
         subdir.mkdir()
         (subdir / "app.py").write_text('print("app")\n')
         
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        app_prog = next(p for p in programs if p.name == "app.py")
+        app_prog = omni_runner.programs_by_name["app.py"]
         assert app_prog.relative_path == "src/app.py"
 
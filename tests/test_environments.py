@@ -9,11 +9,10 @@ This module tests:
 """
 
 import os
-import pytest
-from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
-from conftest import *
+from conftest import link_template
 
 
 class TestVirtualEnvironmentDetection:
@@ -116,39 +115,59 @@ class TestDockerDetection:
         assert env is not None
         assert env.type == "docker-compose"
     
-    def test_no_docker_when_disabled(self, dockerfile_project, omni_runner_with_config):
-        """Test that Docker detection can be disabled."""
-        # Config has enable_docker: true by default, but we can override
-        omni_runner_with_config.config['enable_docker'] = False
+    def test_detect_docker_compose_yaml_extension(self, temp_dir, omni_runner):
+        """Test that docker-compose.yaml is detected as well as .yml."""
+        (temp_dir / "docker-compose.yaml").write_text('version: "3.8"\n')
         
-        env = omni_runner_with_config.detect_environment(omni_runner_with_config.base_path)
-        
-        # Should not detect docker when disabled
-        assert env is None or env.type != "docker"
-
-
-class TestNoEnvironment:
-    """Tests for projects without environments."""
-    
-    def test_simple_python_no_env(self, python_simple_script, omni_runner):
-        """Test that simple Python project has no environment."""
         env = omni_runner.detect_environment(omni_runner.base_path)
         
-        assert env is None
+        assert env is not None
+        assert env.type == "docker-compose"
+        assert env.path.name == "docker-compose.yaml"
     
-    def test_simple_node_no_env(self, nodejs_simple_script, omni_runner):
-        """Test that simple Node.js project has no environment."""
+    def test_no_docker_when_disabled(self, omni_runner, monkeypatch):
+        """Test that disabling Docker skips the Dockerfile lookup entirely."""
+        looked_up = []
+        
+        class RecordingEntries(dict):
+            def get(self, name, default=None):
+                looked_up.append(name)
+                return super().get(name, default)
+        
+        # A Dockerfile is "present" without touching the filesystem
+        dockerfile = SimpleNamespace(name="Dockerfile")
+        monkeypatch.setattr(omni_runner, "_list_directory",
+                            lambda path: RecordingEntries(Dockerfile=dockerfile))
+        omni_runner.config['enable_docker'] = False
+        
         env = omni_runner.detect_environment(omni_runner.base_path)
         
         assert env is None
+        assert "Dockerfile" not in looked_up
+
+
+class TestNoEnvironment:
+    """Tests for projects without environments."""
     
-    def test_simple_go_no_env(self, go_simple_program, omni_runner):
-        """Test that simple Go project has no environment."""
+    def test_simple_project_no_env(self, simple_project, omni_runner):
+        """Test that simple Python, Node.js and Go projects have no environment."""
         env = omni_runner.detect_environment(omni_runner.base_path)
         
         assert env is None
 
 
+class TestMarkerFileLookup:
+    """Tests for how marker files are looked up outside a scan."""
+    
+    def test_each_detection_lists_directory_once(self, mixed_project, omni_runner):
+        """Test that environment and task runner detection list the directory once per call."""
+        with patch("omni_run.os.scandir", wraps=os.scandir) as mock_scandir:
+            omni_runner.detect_environment(omni_runner.base_path)
+            assert mock_scandir.call_count == 1
+            omni_runner.detect_task_runners(omni_runner.base_path)
+            assert mock_scandir.call_count == 2
+
+
 class TestEnvironmentAssociatedWithProgram:
     """Tests for environment association with programs."""
     
@@ -180,6 +199,19 @@ class TestTaskRunnerDetection:
         make_runner = next((r for r in runners if r.type == "make"), None)
         assert make_runner is not None
     
+    def test_detect_lowercase_makefile_case_insensitive_fs(self, temp_dir, omni_runner,
+                                                           task_runner_templates, monkeypatch):
+        """Test that a lowercase makefile is found where names compare case-insensitively."""
+        link_template(task_runner_templates / "Makefile.phony", temp_dir / "makefile")
+        monkeypatch.setattr(omni_runner, "_case_insensitive_fs", True)
+        
+        runners = omni_runner.detect_task_runners(omni_runner.base_path)
+        
+        make_runner = next((r for r in runners if r.type == "make"), None)
+        assert make_runner is not None
+        assert make_runner.file.name == "makefile"
+        assert make_runner.file.exists()
+    
     def test_makefile_tasks(self, makefile_project, omni_runner):
         """Test that Makefile tasks are parsed."""
         runners = omni_runner.detect_task_runners(omni_runner.base_path)
@@ -246,25 +278,25 @@ class TestTaskRunnerAssociation:
     
     def test_program_has_task_runners(self, makefile_project, omni_runner):
         """Test that programs have task runners attached."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        python_prog = next(p for p in programs if p.name == "app.py")
+        python_prog = omni_runner.programs_by_name["app.py"]
         assert python_prog is not None
         assert len(python_prog.task_runners) > 0
     
     def test_program_has_make_runner(self, makefile_project, omni_runner):
         """Test that program has make task runner."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        python_prog = next(p for p in programs if p.name == "app.py")
+        python_prog = omni_runner.programs_by_name["app.py"]
         make_runner = next((r for r in python_prog.task_runners if r.type == "make"), None)
         assert make_runner is not None
     
     def test_program_has_npm_runner(self, nodejs_express_app, omni_runner):
         """Test that program has npm task runner."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        js_prog = next(p for p in programs if p.name == "app.js")
+        js_prog = omni_runner.programs_by_name["app.js"]
         assert js_prog is not None
         npm_runner = next((r for r in js_prog.task_runners if r.type == "npm"), None)
         assert npm_runner is not None
@@ -273,17 +305,10 @@ class TestTaskRunnerAssociation:
 class TestMultipleTaskRunners:
     """Tests for projects with multiple task runners."""
     
-    def test_multiple_task_runners_detected(self, temp_dir, omni_runner):
+    def test_multiple_task_runners_detected(self, temp_dir, omni_runner, task_runner_templates):
         """Test that multiple task runners are detected."""
-        # Create Makefile
-        (temp_dir / "Makefile").write_text('''
-.PHONY: test
-test:
-    echo "make test"
-''')
-        
-        # Create package.json
-        (temp_dir / "package.json").write_text('{"scripts": {"test": "echo npm test"}}')
+        link_template(task_runner_templates / "Makefile.phony", temp_dir / "Makefile")
+        link_template(task_runner_templates / "package.json", temp_dir / "package.json")
         
         runners = omni_runner.detect_task_runners(omni_runner.base_path)
         
@@ -295,21 +320,9 @@ test:
 class TestTaskRunnerWithDescriptions:
     """Tests for task runner descriptions."""
     
-    def test_makefile_with_comments(self, temp_dir, omni_runner):
+    def test_makefile_with_comments(self, temp_dir, omni_runner, task_runner_templates):
         """Test that Makefile task descriptions are parsed."""
-        (temp_dir / "Makefile").write_text('''
-# Build the application
-build:
-    echo "building"
-
-# Run tests
-test:
-    echo "testing"
-
-# Deploy the application
-deploy: # Deploy to production
-    echo "deploying"
-''')
+        link_template(task_runner_templates / "Makefile.commented", temp_dir / "Makefile")
         
         runners = omni_runner.detect_task_runners(omni_runner.base_path)
         
@@ -320,6 +333,7 @@ deploy: # Deploy to production
         tasks_with_desc = [t for t in make_runner.tasks if ':' in t]
         # At least some tasks should have descriptions
         assert len(tasks_with_desc) >= 0  # Description parsing is best-effort
+        assert "deploy: Deploy to production" in make_runner.tasks
 
 
 class TestNoTaskRunners:
@@ -327,9 +341,9 @@ class TestNoTaskRunners:
     
     def test_simple_python_no_task_runners(self, python_simple_script, omni_runner):
         """Test that simple Python project has no task runners."""
-        programs = omni_runner.scan_for_executables()
+        omni_runner.scan_for_executables()
         
-        simple_prog = next(p for p in programs if p.name == "hello.py")
+        simple_prog = omni_runner.programs_by_name["hello.py"]
         assert len(simple_prog.task_runners) == 0
     
     def test_explicit_no_task_runners(self, temp_dir, omni_runner):
@@ -345,19 +359,12 @@ class TestNoTaskRunners:
 class TestEnvironmentActivationHints:
     """Tests for environment activation hints."""
     
-    def test_shows_venv_activation(self, python_with_venv, omni_runner, capsys):
-        """Test that venv activation hints are shown."""
-        omni_runner.scan_for_executables()
-        omni_runner.show_environment_activation_hints()
-        
-        captured = capsys.readouterr()
-        assert "source" in captured.out.lower() or "activate" in captured.out.lower()
-    
-    def test_shows_docker_activation(self, dockerfile_project, omni_runner, capsys):
-        """Test that Docker activation hints are shown."""
+    def test_activation_hints_venv_and_docker(self, mixed_project, omni_runner, capsys):
+        """Test that venv and Docker activation hints are shown together."""
         omni_runner.scan_for_executables()
         omni_runner.show_environment_activation_hints()
         
-        captured = capsys.readouterr()
-        assert "docker" in captured.out.lower()
+        out = capsys.readouterr().out.lower()
+        assert "source" in out or "activate" in out
+        assert "docker" in out
 
@@ -8,201 +8,201 @@ This module tests:
 - Error handling during execution
 """
 
-import os
-import sys
+import subprocess
+import dataclasses
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
-from datetime import datetime
+from unittest.mock import patch
 
-from conftest import *
+from conftest import scan_cached
 import omni_run
 
 
+@pytest.fixture(scope="session")
+def all_test_scripts(tmp_path_factory) -> Path:
+    """Write the scripts that need a real interpreter once per session."""
+    scripts_dir = tmp_path_factory.mktemp("execution_scripts")
+    (scripts_dir / "echo_args.py").write_text('import sys\nprint(sys.argv[1:])\n')
+    (scripts_dir / "env_test.py").write_text('import os\nprint(os.environ.get("TEST_VAR", "default"))\n')
+    (scripts_dir / "moderate.py").write_text('\n'.join(['def func():\n    pass'] * 100))
+    (scripts_dir / "success.py").write_text('print("success")\n')
+    (scripts_dir / "large_output.py").write_text('for i in range(20000):\n    print(i)\n')
+    return scripts_dir
+
+
+def _python_program(path: Path) -> omni_run.ExecutableProgram:
+    """Build a Python program record directly instead of scanning for it."""
+    return omni_run.ExecutableProgram(
+        path=path,
+        name=path.name,
+        relative_path=path.name,
+        type="Python",
+        interpreters=["python"],
+        score=10,
+        dependencies=[],
+        has_config=False,
+        config_files=[],
+        estimated_complexity="Simple"
+    )
+
+
+@pytest.fixture(scope="session")
+def success_program(all_test_scripts) -> omni_run.ExecutableProgram:
+    """An always-succeeding program, shared without a scan."""
+    return _python_program(all_test_scripts / "success.py")
+
+
 class TestSynchronousExecution:
     """Tests for synchronous program execution."""
     
-    def test_execute_simple_python(self, python_simple_script, omni_runner):
+    @pytest.mark.integration
+    def test_execute_simple_python(self, simple_script_runner):
         """Test executing a simple Python script."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        result = omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        result = simple_script_runner.execute_program_synchronously(prog)
         
         assert result.status in [omni_run.ExecutionStatus.SUCCESS, omni_run.ExecutionStatus.FAILED]
         assert result.program == prog
         assert result.start_time <= result.end_time
         assert result.duration >= 0
     
-    def test_execute_python_with_output(self, python_simple_script, omni_runner):
+    @pytest.mark.integration
+    def test_execute_python_with_output(self, simple_script_runner):
         """Test that Python script output is captured."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        result = omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        result = simple_script_runner.execute_program_synchronously(prog)
         
         # Should capture stdout
         assert result.stdout is not None
         # May contain "Hello, World!" depending on interpreter availability
     
-    def test_execution_returns_result_object(self, python_simple_script, omni_runner):
+    @pytest.mark.integration
+    def test_execution_returns_result_object(self, simple_script_runner):
         """Test that execution returns an ExecutionResult."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        result = omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        result = simple_script_runner.execute_program_synchronously(prog)
         
-        assert result is not None
-        assert hasattr(result, 'status')
-        assert hasattr(result, 'start_time')
-        assert hasattr(result, 'end_time')
-        assert hasattr(result, 'duration')
-        assert hasattr(result, 'return_code')
-        assert hasattr(result, 'stdout')
-        assert hasattr(result, 'stderr')
+        expected = {'status', 'start_time', 'end_time', 'duration', 'return_code', 'stdout', 'stderr'}
+        assert isinstance(result, omni_run.ExecutionResult)
+        assert expected <= {f.name for f in dataclasses.fields(result)}
     
-    def test_execution_with_nonexistent_file(self, temp_dir, omni_runner):
+    @pytest.mark.integration
+    def test_execution_with_nonexistent_file(self, omni_runner):
         """Test handling of non-existent program file."""
-        from omni_run import ExecutableProgram, ExecutionResult, ExecutionStatus
-        
-        fake_prog = ExecutableProgram(
-            path=Path("/nonexistent/file.py"),
-            name="nonexistent.py",
-            relative_path="nonexistent.py",
-            type="Python",
-            interpreters=["python"],
-            score=10,
-            dependencies=[],
-            has_config=False,
-            config_files=[],
-            estimated_complexity="Simple"
-        )
+        fake_prog = _python_program(Path("/nonexistent/file.py"))
         
         result = omni_runner.execute_program_synchronously(fake_prog)
         
-        assert result.status == ExecutionStatus.ERROR
+        assert result.status == omni_run.ExecutionStatus.ERROR
         assert result.error_message is not None
 
 
+@pytest.mark.integration
 class TestExecutionWithArguments:
     """Tests for execution with command-line arguments."""
     
-    def test_execute_with_args_list(self, python_main_pattern, omni_runner):
+    def test_execute_with_args_list(self, all_test_scripts, omni_runner):
         """Test executing with args passed as list."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
-            pytest.skip("No programs discovered")
+        omni_runner.base_path = all_test_scripts.resolve()
+        scan_cached(omni_runner)
+        prog = omni_runner.programs_by_name["echo_args.py"]
         
-        prog = omni_runner.discovered_programs[0]
+        result = omni_runner.execute_program_synchronously(prog, args=["--help"])
         
-        # Some programs may not accept args
-        try:
-            result = omni_runner.execute_program_synchronously(prog, args=["--help"])
-            assert result is not None
-            assert result.args == ["--help"]
-        except Exception:
-            # Some programs may fail with args - that's OK
-            pass
+        assert result.args == ["--help"]
+        assert "['--help']" in result.stdout
 
 
 class TestExecutionResultStatus:
     """Tests for execution result status values."""
     
-    def test_success_status(self, python_simple_script, omni_runner):
-        """Test successful execution has SUCCESS status."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
-            pytest.skip("No programs discovered")
+    @pytest.mark.parametrize("returncode,status", [
+        (0, omni_run.ExecutionStatus.SUCCESS),
+        (1, omni_run.ExecutionStatus.FAILED),
+        (42, omni_run.ExecutionStatus.FAILED),
+    ])
+    def test_status_from_return_code(self, returncode, status, omni_runner, success_program, mock_subprocess):
+        """Test that the return code is forwarded and mapped to a status."""
+        mock_subprocess.return_value = subprocess.CompletedProcess(
+            args=['python', 'success.py'], returncode=returncode, stdout="", stderr=""
+        )
         
-        prog = omni_runner.discovered_programs[0]
-        result = omni_runner.execute_program_synchronously(prog)
+        result = omni_runner.execute_program_synchronously(success_program)
         
-        # Status should be SUCCESS if return code is 0
-        if result.return_code == 0:
-            assert result.status == omni_run.ExecutionStatus.SUCCESS
+        assert result.return_code == returncode
+        assert result.status == status
     
-    def test_failed_status(self, temp_dir, omni_runner):
-        """Test failed execution has FAILED status."""
-        # Create a script that exits with non-zero code
-        script = temp_dir / "fail.py"
-        script.write_text('import sys\nsys.exit(1)\n')
-        
-        omni_runner.scan_for_executables()
-        
-        prog = next((p for p in omni_runner.discovered_programs if p.name == "fail.py"), None)
-        if prog is None:
-            pytest.skip("Program not discovered")
+    def test_output_passed_through(self, omni_runner, success_program, mock_subprocess):
+        """Test that captured stdout and stderr are forwarded unchanged."""
+        mock_subprocess.return_value = subprocess.CompletedProcess(
+            args=['python', 'success.py'], returncode=0,
+            stdout="test output\n", stderr="error message\n"
+        )
         
-        result = omni_runner.execute_program_synchronously(prog)
+        result = omni_runner.execute_program_synchronously(success_program)
         
-        assert result.status == omni_run.ExecutionStatus.FAILED
-        assert result.return_code == 1
+        assert result.stdout == "test output\n"
+        assert result.stderr == "error message\n"
+        assert mock_subprocess.call_args.kwargs["capture_output"] is True
+        assert mock_subprocess.call_args.kwargs["text"] is True
 
 
+@pytest.mark.integration
 class TestExecutionHistory:
     """Tests for execution history tracking."""
     
-    def test_execution_history_populated(self, python_simple_script, omni_runner):
+    def test_execution_history_populated(self, simple_script_runner):
         """Test that execution history is populated."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        simple_script_runner.execute_program_synchronously(prog)
         
-        assert len(omni_runner.execution_history) >= 1
+        assert len(simple_script_runner.execution_history) >= 1
     
-    def test_execution_history_contains_result(self, python_simple_script, omni_runner):
+    def test_execution_history_contains_result(self, simple_script_runner):
         """Test that execution history contains the result."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        result = omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        result = simple_script_runner.execute_program_synchronously(prog)
         
-        assert result in omni_runner.execution_history
+        assert result in simple_script_runner.execution_history
 
 
+@pytest.mark.integration
 class TestExecutionDuration:
     """Tests for execution duration tracking."""
     
-    def test_duration_calculated(self, python_simple_script, omni_runner):
+    def test_duration_calculated(self, simple_script_runner):
         """Test that execution duration is calculated."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        result = omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        result = simple_script_runner.execute_program_synchronously(prog)
         
         assert result.duration >= 0
         assert isinstance(result.duration, float)
     
-    def test_start_before_end_time(self, python_simple_script, omni_runner):
+    def test_start_before_end_time(self, simple_script_runner):
         """Test that start_time is before end_time."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        result = omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        result = simple_script_runner.execute_program_synchronously(prog)
         
         assert result.start_time <= result.end_time
 
@@ -210,247 +210,140 @@ class TestExecutionDuration:
 class TestExecutionByIndex:
     """Tests for executing programs by index."""
     
-    def test_execute_by_valid_index(self, python_simple_script, omni_runner):
+    @pytest.mark.integration
+    def test_execute_by_valid_index(self, simple_script_runner):
         """Test executing program by valid index."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        result = omni_runner.execute_program(index=0)
+        result = simple_script_runner.execute_program(index=0)
         
         assert result is not None
-        assert result.program in omni_runner.discovered_programs
+        assert result.program in simple_script_runner.discovered_programs
     
-    def test_execute_by_invalid_index(self, omni_runner):
+    def test_execute_by_invalid_index(self, simple_script_runner):
         """Test executing by invalid index raises error."""
-        omni_runner.scan_for_executables()
-        
         with pytest.raises(ValueError):
-            omni_runner.execute_program(index=999)
+            simple_script_runner.execute_program(index=999)
     
-    def test_negative_index_error(self, omni_runner):
+    def test_negative_index_error(self, simple_script_runner):
         """Test that negative index raises error."""
-        omni_runner.scan_for_executables()
-        
         with pytest.raises(ValueError):
-            omni_runner.execute_program(index=-1)
-
-
-class TestExecutionReturnCode:
-    """Tests for return code handling."""
-    
-    def test_return_code_zero_success(self, temp_dir, omni_runner):
-        """Test that return code 0 indicates success."""
-        script = temp_dir / "success.py"
-        script.write_text('print("success")\n')
-        
-        omni_runner.scan_for_executables()
-        
-        prog = next((p for p in omni_runner.discovered_programs if p.name == "success.py"), None)
-        if prog is None:
-            pytest.skip("Program not discovered")
-        
-        result = omni_runner.execute_program_synchronously(prog)
-        
-        # Return code should be 0
-        assert result.return_code == 0
-    
-    def test_return_code_nonzero_failure(self, temp_dir, omni_runner):
-        """Test that non-zero return code indicates failure."""
-        script = temp_dir / "fail.py"
-        script.write_text('import sys\nsys.exit(42)\n')
-        
-        omni_runner.scan_for_executables()
-        
-        prog = next((p for p in omni_runner.discovered_programs if p.name == "fail.py"), None)
-        if prog is None:
-            pytest.skip("Program not discovered")
-        
-        result = omni_runner.execute_program_synchronously(prog)
-        
-        assert result.return_code == 42
+            simple_script_runner.execute_program(index=-1)
 
 
-class TestExecutionStdout:
-    """Tests for stdout capture."""
+@pytest.mark.integration
+class TestScriptExecution:
+    """Tests that run real scripts from the shared scripts directory."""
     
-    def test_stdout_captured(self, temp_dir, omni_runner):
-        """Test that stdout is captured."""
-        script = temp_dir / "output.py"
-        script.write_text('print("test output")\n')
-        
-        omni_runner.scan_for_executables()
-        
-        prog = next((p for p in omni_runner.discovered_programs if p.name == "output.py"), None)
-        if prog is None:
-            pytest.skip("Program not discovered")
+    def test_execution_with_env_vars(self, all_test_scripts, omni_runner, monkeypatch):
+        """Test that the child process inherits environment variables."""
+        monkeypatch.setenv("TEST_VAR", "test_value")
+        omni_runner.base_path = all_test_scripts.resolve()
+        scan_cached(omni_runner)
+        prog = omni_runner.programs_by_name["env_test.py"]
         
         result = omni_runner.execute_program_synchronously(prog)
         
-        assert result.stdout is not None
-        # Should contain the output
-        assert "test output" in result.stdout or result.stdout == ""
-
-
-class TestExecutionStderr:
-    """Tests for stderr capture."""
+        assert "test_value" in result.stdout
     
-    def test_stderr_captured(self, temp_dir, omni_runner):
-        """Test that stderr is captured."""
-        script = temp_dir / "stderr.py"
-        script.write_text('import sys\nsys.stderr.write("error message\\n")\n')
-        
-        omni_runner.scan_for_executables()
+    def test_large_stdout_captured(self, all_test_scripts, omni_runner):
+        """Test that output larger than a pipe buffer (~110KB) is captured intact."""
+        omni_runner.base_path = all_test_scripts.resolve()
+        scan_cached(omni_runner)
         
-        prog = next((p for p in omni_runner.discovered_programs if p.name == "stderr.py"), None)
-        if prog is None:
-            pytest.skip("Program not discovered")
+        prog = omni_runner.programs_by_name.get("large_output.py")
+        assert prog is not None
         
         result = omni_runner.execute_program_synchronously(prog)
         
-        assert result.stderr is not None
+        assert result.return_code == 0
+        assert result.stdout.endswith("19999\n")
 
 
 class TestExecutionTimeout:
     """Tests for execution timeout handling."""
     
-    def test_timeout_respected(self, temp_dir, omni_runner):
+    def test_timeout_respected(self, temp_dir, isolated_omni_runner):
         """Test that timeout is respected."""
-        script = temp_dir / "slow.py"
-        script.write_text('import time\ntime.sleep(10)\n')
-        
-        omni_runner.scan_for_executables()
+        prog = _python_program(temp_dir / "slow.py")
         
         # Set short timeout for test
-        omni_runner.config['timeout'] = 1
+        isolated_omni_runner.config['timeout'] = 1
         
-        prog = next((p for p in omni_runner.discovered_programs if p.name == "slow.py"), None)
-        if prog is None:
-            pytest.skip("Program not discovered")
-        
-        result = omni_runner.execute_program_synchronously(prog)
+        # Time out immediately instead of waiting on a real sleeping process
+        with patch('omni_run.subprocess.run',
+                   side_effect=subprocess.TimeoutExpired(cmd=['python'], timeout=1)) as mock_run:
+            result = isolated_omni_runner.execute_program_synchronously(prog)
         
-        # Should have timed out
+        assert mock_run.call_args.kwargs['timeout'] == 1
         assert result.status == omni_run.ExecutionStatus.ERROR
-        assert "timeout" in result.error_message.lower() or result.return_code is None
+        assert "timed out" in result.error_message.lower()
+        assert result.return_code is None
 
 
+@pytest.mark.integration
 class TestPreferredCommand:
     """Tests for preferred command storage."""
     
-    def test_preferred_command_saved(self, python_simple_script, omni_runner):
+    def test_preferred_command_saved(self, simple_script_runner):
         """Test that preferred command is saved after execution."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        simple_script_runner.execute_program_synchronously(prog)
         
         # Should have saved preferred command
         key = f"{prog.type}:{prog.name}"
-        assert key in omni_runner.preferred_commands
+        assert key in simple_script_runner.preferred_commands
     
-    def test_preferred_command_contains_command(self, python_simple_script, omni_runner):
+    def test_preferred_command_contains_command(self, simple_script_runner):
         """Test that saved command contains the execution command."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
-        omni_runner.execute_program_synchronously(prog)
+        prog = simple_script_runner.discovered_programs[0]
+        simple_script_runner.execute_program_synchronously(prog)
         
         key = f"{prog.type}:{prog.name}"
-        command = omni_runner.preferred_commands[key]
+        command = simple_script_runner.preferred_commands[key]
         
         assert command is not None
         assert len(command) > 0
 
 
+@pytest.mark.integration
 class TestExecuteProgramMethod:
     """Tests for the execute_program method with auto-fix."""
     
-    def test_execute_with_auto_fix_disabled(self, python_simple_script, omni_runner):
-        """Test execute_program with auto_fix=False."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
-            pytest.skip("No programs discovered")
-        
-        # Should execute without auto-fix
-        result = omni_runner.execute_program(0, auto_fix=False)
-        
-        assert result is not None
-    
-    def test_execute_with_auto_fix_enabled(self, python_simple_script, omni_runner):
-        """Test execute_program with auto_fix=True."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
-            pytest.skip("No programs discovered")
-        
-        omni_runner.config['auto_fix'] = True
+    @pytest.mark.parametrize("auto_fix", [False, True])
+    def test_execute_auto_fix(self, auto_fix, simple_script_runner, monkeypatch):
+        """Test execute_program with auto-fix disabled and enabled."""
+        monkeypatch.setitem(simple_script_runner.config, 'auto_fix', auto_fix)
         
-        # Should attempt auto-fix if needed
-        result = omni_runner.execute_program(0, auto_fix=True)
+        result = simple_script_runner.execute_program(0, auto_fix=auto_fix)
         
         assert result is not None
+        assert result.program is simple_script_runner.discovered_programs[0]
 
 
 class TestProgramComplexity:
     """Tests for program complexity estimation."""
     
-    def test_complexity_simple(self, python_simple_script, omni_runner):
+    def test_complexity_simple(self, simple_script_runner):
         """Test that simple script has Simple complexity."""
-        omni_runner.scan_for_executables()
-        
-        if not omni_runner.discovered_programs:
+        if not simple_script_runner.discovered_programs:
             pytest.skip("No programs discovered")
         
-        prog = omni_runner.discovered_programs[0]
+        prog = simple_script_runner.discovered_programs[0]
         
         assert prog.estimated_complexity in ["Simple", "Unknown"]
     
-    def test_complexity_moderate(self, temp_dir, omni_runner):
+    def test_complexity_moderate(self, all_test_scripts, omni_runner):
         """Test complexity estimation for larger files."""
-        # Create a file with more lines
-        script = temp_dir / "moderate.py"
-        lines = ['def func():\n    pass'] * 100
-        script.write_text('\n'.join(lines))
-        
-        omni_runner.scan_for_executables()
-        
-        prog = next((p for p in omni_runner.discovered_programs if p.name == "moderate.py"), None)
-        if prog is None:
-            pytest.skip("Program not discovered")
+        omni_runner.base_path = all_test_scripts.resolve()
+        scan_cached(omni_runner)
+        prog = omni_runner.programs_by_name["moderate.py"]
         
         assert prog.estimated_complexity in ["Moderate", "Complex", "Very Complex"]
-
-
-class TestExecutionEnvironmentVars:
-    """Tests for environment variable handling."""
-    
-    def test_execution_with_env_vars(self, temp_dir, omni_runner):
-        """Test that execution can use environment variables."""
-        script = temp_dir / "env_test.py"
-        script.write_text('import os\nprint(os.environ.get("TEST_VAR", "default"))\n')
-        
-        omni_runner.scan_for_executables()
-        
-        prog = next((p for p in omni_runner.discovered_programs if p.name == "env_test.py"), None)
-        if prog is None:
-            pytest.skip("Program not discovered")
-        
-        # Set environment variable
-        import os as os_mod
-        os_mod.environ["TEST_VAR"] = "test_value"
-        
-        try:
-            result = omni_runner.execute_program_synchronously(prog)
-            assert result is not None
-        finally:
-            del os_mod.environ["TEST_VAR"]
-
@@ -9,226 +9,252 @@ This module tests:
 """
 
 import os
+import re
 import json
 import pytest
 from pathlib import Path
 from datetime import datetime
+from typing import Any, NamedTuple, Optional, Tuple
 
 from conftest import *
+import omni_run
+
+# Most classes here read the module-scoped project_report reports; keeping the
+# module on one pytest-xdist worker under --dist loadgroup renders each once
+pytestmark = pytest.mark.xdist_group("reports")
+
+# orjson parses report bytes directly; fall back to the stdlib when it is missing
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a written JSON report from a single read of the file."""
+    return _loads(read_and_assert(path))
+
+
+# Token checks on HTML reports, each a single case-insensitive pass over the bytes
+_HTML_START_RE = re.compile(rb"<html|<!DOCTYPE", re.IGNORECASE)
+_HTML_END_RE = re.compile(rb"</html>", re.IGNORECASE)
+_FLASK_RE = re.compile(rb"flask", re.IGNORECASE)
+_EXPRESS_RE = re.compile(rb"express", re.IGNORECASE)
+_TAILWIND_RE = re.compile(rb"tailwindcss", re.IGNORECASE)
+_SCRIPT_RE = re.compile(rb"<script", re.IGNORECASE)
+_STATUS_RE = re.compile(rb"ready|issues|" + re.escape("✅".encode()), re.IGNORECASE)
+_DEPENDENCIES_RE = re.compile(rb"dependencies|node_modules", re.IGNORECASE)
+_PYTHON_RE = re.compile(rb"[Pp]ython")
+_GENERATED_DATE_RE = re.compile(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+_PROGRAMS_FOUND_RE = re.compile(rb'>(\d+)</div>\s*<div class="text-sm text-gray-600">Programs Found<')
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def json_backend(request, monkeypatch) -> bool:
+    """Run a test once with orjson and once with the stdlib JSON writer."""
+    use_orjson = request.param
+    if use_orjson and not omni_run.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(omni_run, "ORJSON_AVAILABLE", use_orjson)
+    return use_orjson
+
+
+class GeneratedReport(NamedTuple):
+    """A report rendered in memory from one scan of a shared project."""
+    programs: Tuple[Any, ...]  # snapshot of the programs the report was rendered from
+    content: Optional[bytes] = None  # encoded HTML reports, searched without decoding
+    data: Any = None  # the JSON report as a dict
+
+
+@pytest.fixture(scope="module")
+def project_report(shared_project):
+    """Return a function that scans a shared project and renders one report format once per module.
+    
+    Reports are rendered without touching disk; tests of the file output call
+    generate_*_report() themselves. Shared reports must be treated as read-only.
+    """
+    reports = {}
+    
+    def build(app_name: str, report_format: str) -> GeneratedReport:
+        key = (app_name, report_format)
+        if key not in reports:
+            # A runner per report, so no scan state carries over from the previous project
+            runner = omni_run.OmniRun(str(shared_project(app_name)))
+            programs = tuple(runner.scan_for_executables())
+            if report_format == "json":
+                reports[key] = GeneratedReport(programs, data=runner.build_json_report())
+            else:
+                reports[key] = GeneratedReport(programs, content=runner.render_html_report().encode())
+        return reports[key]
+    return build
 
 
 class TestHTMLReportGeneration:
     """Tests for HTML report generation."""
     
-    def test_generate_html_report(self, python_flask_app, omni_runner, temp_dir):
+    def test_generate_html_report(self, omni_runner, shared_project, scanned_programs, temp_dir):
         """Test basic HTML report generation."""
-        omni_runner.scan_for_executables()
+        scanned_programs(shared_project("python_flask_app"))
         
         output_file = temp_dir / "report.html"
         omni_runner.generate_html_report(str(output_file))
         
-        assert output_file.exists()
-        
-        content = output_file.read_text()
+        content = read_and_assert(output_file)
         
         # Should have basic HTML structure
-        assert "<html" in content.lower() or "<!DOCTYPE html>" in content.upper()
-        assert "</html>" in content.lower()
+        assert _HTML_START_RE.search(content)
+        assert _HTML_END_RE.search(content)
     
-    def test_html_report_contains_program_info(self, python_flask_app, omni_runner, temp_dir):
+    def test_html_report_contains_program_info(self, project_report):
         """Test that HTML report contains program information."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
+        report = project_report("python_flask_app", "html")
+        content = report.content
         
         # Should contain program names
-        assert "Flask" in content or "flask" in content.lower()
+        assert _FLASK_RE.search(content)
     
-    def test_html_report_has_tailwind(self, python_flask_app, omni_runner, temp_dir):
+    def test_html_report_has_tailwind(self, project_report):
         """Test that HTML report uses Tailwind CSS."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
+        report = project_report("python_flask_app", "html")
+        content = report.content
         
         # Should include Tailwind CDN
-        assert "tailwindcss" in content.lower() or "cdn.tailwindcss.com" in content
+        assert _TAILWIND_RE.search(content)
     
-    def test_html_report_has_interactivity(self, python_flask_app, omni_runner, temp_dir):
+    def test_html_report_has_interactivity(self, project_report):
         """Test that HTML report has interactive elements."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
+        report = project_report("python_flask_app", "html")
+        content = report.content
         
         # Should have JavaScript for interactivity
-        assert "<script" in content.lower()
+        assert _SCRIPT_RE.search(content)
     
-    def test_html_report_shows_status(self, python_flask_app, omni_runner, temp_dir):
+    def test_html_report_shows_status(self, project_report):
         """Test that HTML report shows program status."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
+        report = project_report("python_flask_app", "html")
+        content = report.content
         
         # Should show ready or issues status
-        assert "ready" in content.lower() or "issues" in content.lower() or "✅" in content
+        assert _STATUS_RE.search(content)
     
-    def test_html_report_shows_dependencies(self, python_flask_app, omni_runner, temp_dir):
+    def test_html_report_shows_dependencies(self, project_report):
         """Test that HTML report shows dependency information."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
+        report = project_report("python_flask_app", "html")
+        content = report.content
         
         # Should mention dependencies
-        assert "dependencies" in content.lower() or "node_modules" in content.lower()
+        assert _DEPENDENCIES_RE.search(content)
     
-    def test_html_report_multiple_programs(self, multi_language_project, omni_runner, temp_dir):
+    def test_html_report_multiple_programs(self, project_report):
         """Test HTML report with multiple programs."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
+        report = project_report("multi_language_project", "html")
+        content = report.content
         
         # Should contain information about multiple programs
-        assert content.count("Python") + content.count("python") > 1 or len(omni_runner.discovered_programs) > 1
+        assert len(_PYTHON_RE.findall(content)) > 1 or len(report.programs) > 1
     
-    def test_html_report_with_frameworks(self, nodejs_express_app, omni_runner, temp_dir):
+    def test_html_report_with_frameworks(self, project_report):
         """Test HTML report shows framework information."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
+        report = project_report("nodejs_express_app", "html")
+        content = report.content
         
         # Should mention Express
-        assert "express" in content.lower() or "Express" in content
+        assert _EXPRESS_RE.search(content)
     
-    def test_html_file_is_valid_html(self, python_simple_script, omni_runner, temp_dir):
+    def test_html_file_is_valid_html(self, project_report):
         """Test that generated HTML is valid."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
+        report = project_report("python_simple_script", "html")
+        content = report.content
         
         # Basic HTML validation
         assert len(content) > 100  # Should have meaningful content
-        assert "<html" in content.lower() or "<!DOCTYPE" in content
+        assert _HTML_START_RE.search(content)
+
+
+# Structural checks over the simple-script JSON report, all run against one parse
+SIMPLE_REPORT_CHECKS = {
+    "project": lambda data: data.get("project") is not None,
+    "generated_at": lambda data: data.get("generated_at") is not None,
+    "summary.total_programs": lambda data: "total_programs" in data.get("summary", {}),
+    "program_fields": lambda data: all(
+        {"name", "path", "type", "score", "complexity"} <= prog.keys() for prog in data["programs"]
+    ),
+}
 
 
 class TestJSONReportGeneration:
     """Tests for JSON report generation."""
     
-    def test_generate_json_report(self, python_simple_script, omni_runner, temp_dir):
+    def test_generate_json_report(self, simple_script_runner, temp_dir):
         """Test basic JSON report generation."""
-        omni_runner.scan_for_executables()
-        
         output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        assert output_file.exists()
+        simple_script_runner.generate_json_report(str(output_file))
         
         # Should be valid JSON
-        data = json.loads(output_file.read_text())
+        data = _load_json_file(output_file)
         assert data is not None
     
-    def test_json_report_has_project_info(self, python_simple_script, omni_runner, temp_dir):
-        """Test that JSON report contains project information."""
-        omni_runner.scan_for_executables()
-        
+    def test_written_json_matches_built_report(self, simple_script_runner, temp_dir, json_backend):
+        """Test that the JSON file holds the report returned by build_json_report."""
         output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        simple_script_runner.generate_json_report(str(output_file))
         
-        # Should have project path
-        assert "project" in data
-        assert data["project"] is not None
+        written = _load_json_file(output_file)
+        built = simple_script_runner.build_json_report()
+        written.pop("generated_at")
+        built.pop("generated_at")
+        assert written == built
     
-    def test_json_report_has_generation_time(self, python_simple_script, omni_runner, temp_dir):
-        """Test that JSON report includes generation timestamp."""
+    def test_json_report_round_trips_non_ascii_names(self, temp_dir, omni_runner, json_backend):
+        """Test that both JSON backends write non-ASCII names that parse back unchanged."""
+        (temp_dir / "héllo.py").write_text('print("hello")\n')
         omni_runner.scan_for_executables()
         
         output_file = temp_dir / "report.json"
         omni_runner.generate_json_report(str(output_file))
         
-        data = json.loads(output_file.read_text())
-        
-        # Should have generation time
-        assert "generated_at" in data
-        assert data["generated_at"] is not None
+        data = _load_json_file(output_file)
+        assert [prog["path"] for prog in data["programs"]] == ["héllo.py"]
     
-    def test_json_report_has_summary(self, python_simple_script, omni_runner, temp_dir):
-        """Test that JSON report includes summary."""
+    def test_json_report_with_non_utf8_file_name(self, temp_dir, omni_runner, json_backend):
+        """Test that a file name that is not valid UTF-8 still produces a valid report."""
+        try:
+            fd = os.open(os.path.join(os.fsencode(temp_dir), b"caf\xe9.py"), os.O_WRONLY | os.O_CREAT)
+        except OSError:
+            pytest.skip("filesystem rejects file names that are not valid UTF-8")
+        os.write(fd, b'print("hello")\n')
+        os.close(fd)
         omni_runner.scan_for_executables()
         
         output_file = temp_dir / "report.json"
         omni_runner.generate_json_report(str(output_file))
         
-        data = json.loads(output_file.read_text())
-        
-        # Should have summary
-        assert "summary" in data
-        assert "total_programs" in data["summary"]
+        data = json.loads(read_and_assert(output_file))
+        assert [prog["path"] for prog in data["programs"]] == [os.fsdecode(b"caf\xe9.py")]
     
-    def test_json_report_has_programs(self, python_simple_script, omni_runner, temp_dir):
+    def test_json_report_has_programs(self, project_report):
         """Test that JSON report contains program list."""
-        omni_runner.scan_for_executables()
+        report = project_report("python_simple_script", "json")
         
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        data = report.data
         
         # Should have programs array
         assert "programs" in data
         assert isinstance(data["programs"], list)
-        assert len(data["programs"]) == len(omni_runner.discovered_programs)
+        assert len(data["programs"]) == len(report.programs)
     
-    def test_json_program_has_required_fields(self, python_simple_script, omni_runner, temp_dir):
-        """Test that JSON program entries have required fields."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
-        
-        if len(data["programs"]) > 0:
-            prog = data["programs"][0]
-            
-            # Check required fields
-            assert "name" in prog
-            assert "path" in prog
-            assert "type" in prog
-            assert "score" in prog
-            assert "complexity" in prog
+    @pytest.mark.parametrize("check", list(SIMPLE_REPORT_CHECKS.values()), ids=list(SIMPLE_REPORT_CHECKS))
+    def test_simple_script_report_structure(self, project_report, check):
+        """Test one structural property of the simple-script JSON report."""
+        data = project_report("python_simple_script", "json").data
+        assert check(data)
     
-    def test_json_program_has_dependencies(self, python_flask_app, omni_runner, temp_dir):
+    def test_json_program_has_dependencies(self, project_report):
         """Test that JSON report includes dependency information."""
-        omni_runner.scan_for_executables()
+        report = project_report("python_flask_app", "json")
         
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        data = report.data
         
         if len(data["programs"]) > 0:
             prog = data["programs"][0]
@@ -237,14 +263,11 @@ class TestJSONReportGeneration:
             assert "dependencies" in prog
             assert isinstance(prog["dependencies"], list)
     
-    def test_json_dependencies_have_fix_info(self, nodejs_express_app, omni_runner, temp_dir):
+    def test_json_dependencies_have_fix_info(self, project_report):
         """Test that JSON dependencies include fix command info."""
-        omni_runner.scan_for_executables()
+        report = project_report("nodejs_express_app", "json")
         
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        data = report.data
         
         # Find a program with dependencies
         programs_with_deps = [p for p in data["programs"] if p.get("dependencies")]
@@ -256,14 +279,11 @@ class TestJSONReportGeneration:
             assert "fix_command" in dep
             assert "can_auto_fix" in dep
     
-    def test_json_report_has_framework(self, python_flask_app, omni_runner, temp_dir):
+    def test_json_report_has_framework(self, project_report):
         """Test that JSON report includes framework information."""
-        omni_runner.scan_for_executables()
+        report = project_report("python_flask_app", "json")
         
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        data = report.data
         
         # Find Flask program
         flask_prog = next((p for p in data["programs"] if "Flask" in str(p.get("framework", ""))), None)
@@ -271,14 +291,11 @@ class TestJSONReportGeneration:
         if flask_prog:
             assert flask_prog.get("framework") == "Flask"
     
-    def test_json_report_has_task_runners(self, nodejs_express_app, omni_runner, temp_dir):
+    def test_json_report_has_task_runners(self, project_report):
         """Test that JSON report includes task runner information."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
+        report = project_report("nodejs_express_app", "json")
         
-        data = json.loads(output_file.read_text())
+        data = report.data
         
         # Find Express program
         express_prog = next((p for p in data["programs"] if p.get("framework") == "Express.js"), None)
@@ -287,17 +304,11 @@ class TestJSONReportGeneration:
             assert "task_runners" in express_prog
             assert "npm" in express_prog["task_runners"]
     
-    def test_json_report_is_machine_readable(self, multi_language_project, omni_runner, temp_dir):
+    def test_json_report_is_machine_readable(self, project_report):
         """Test that JSON report is properly formatted for machine reading."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        content = output_file.read_text()
-        
+        report = project_report("multi_language_project", "json")
         # Should be parseable without errors
-        data = json.loads(content)
+        data = report.data
         
         # Should have expected structure
         assert "summary" in data
@@ -308,28 +319,22 @@ class TestJSONReportGeneration:
         assert "ready_count" in data["summary"]
         assert "issues_count" in data["summary"]
     
-    def test_json_summary_counts(self, python_flask_app, omni_runner, temp_dir):
+    def test_json_summary_counts(self, project_report):
         """Test that JSON summary has correct counts."""
-        omni_runner.scan_for_executables()
+        report = project_report("python_flask_app", "json")
         
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        data = report.data
         
-        assert data["summary"]["total_programs"] == len(omni_runner.discovered_programs)
+        assert data["summary"]["total_programs"] == len(report.programs)
         
         # ready + issues should equal total
         assert data["summary"]["ready_count"] + data["summary"]["issues_count"] == data["summary"]["total_programs"]
     
-    def test_json_by_type_counts(self, multi_language_project, omni_runner, temp_dir):
+    def test_json_by_type_counts(self, project_report):
         """Test that JSON summary includes program counts by type."""
-        omni_runner.scan_for_executables()
+        report = project_report("multi_language_project", "json")
         
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        data = report.data
         
         assert "by_type" in data["summary"]
         
@@ -341,72 +346,59 @@ class TestJSONReportGeneration:
 class TestReportFilePaths:
     """Tests for report file path handling."""
     
-    def test_html_report_to_new_path(self, python_simple_script, omni_runner, temp_dir):
+    def test_html_report_to_new_path(self, simple_script_runner, temp_dir):
         """Test generating HTML report to a new path."""
-        omni_runner.scan_for_executables()
-        
         output_file = temp_dir / "subdir" / "report.html"
         
         # Should create parent directories
-        omni_runner.generate_html_report(str(output_file))
+        simple_script_runner.generate_html_report(str(output_file))
         
         assert output_file.exists()
     
-    def test_json_report_to_new_path(self, python_simple_script, omni_runner, temp_dir):
+    def test_json_report_to_new_path(self, simple_script_runner, temp_dir):
         """Test generating JSON report to a new path."""
-        omni_runner.scan_for_executables()
-        
         output_file = temp_dir / "subdir" / "report.json"
         
         # Should create parent directories
-        omni_runner.generate_json_report(str(output_file))
+        simple_script_runner.generate_json_report(str(output_file))
         
         assert output_file.exists()
     
-    def test_overwrite_existing_report(self, python_simple_script, omni_runner, temp_dir):
+    def test_overwrite_existing_report(self, simple_script_runner, temp_dir):
         """Test overwriting existing report file."""
-        omni_runner.scan_for_executables()
-        
         output_file = temp_dir / "report.html"
         
         # Create initial report
-        omni_runner.generate_html_report(str(output_file))
-        initial_content = output_file.read_text()
+        simple_script_runner.generate_html_report(str(output_file))
+        initial_content = read_and_assert(output_file)
         
         # Modify file
         output_file.write_text("modified")
         
         # Generate new report
-        omni_runner.scan_for_executables()  # Rescan to get new data
-        omni_runner.generate_html_report(str(output_file))
+        simple_script_runner.generate_html_report(str(output_file))
         
         # File should be overwritten
-        new_content = output_file.read_text()
-        assert new_content != "modified"
-        assert "<html" in new_content.lower() or "<!DOCTYPE" in new_content
+        new_content = read_and_assert(output_file)
+        assert new_content != b"modified"
+        assert _HTML_START_RE.search(new_content)
 
 
 class TestReportWithNoPrograms:
     """Tests for reports when no programs are found."""
     
-    def test_html_report_empty(self, empty_directory, omni_runner, temp_dir):
+    def test_html_report_empty(self, project_report):
         """Test HTML report with no programs."""
-        omni_runner.scan_for_executables()
+        report = project_report("empty_directory", "html")
         
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
-        assert "0" in content or "No programs" in content or len(omni_runner.discovered_programs) == 0
+        assert len(report.programs) == 0
+        match = _PROGRAMS_FOUND_RE.search(report.content)
+        assert match is not None
+        assert match.group(1) == b"0"
     
-    def test_json_report_empty(self, empty_directory, omni_runner, temp_dir):
+    def test_json_report_empty(self, project_report):
         """Test JSON report with no programs."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        data = project_report("empty_directory", "json").data
         
         assert data["summary"]["total_programs"] == 0
         assert len(data["programs"]) == 0
@@ -415,28 +407,18 @@ class TestReportWithNoPrograms:
 class TestReportTimestamps:
     """Tests for timestamp handling in reports."""
     
-    def test_html_report_has_timestamp(self, python_simple_script, omni_runner, temp_dir):
+    def test_html_report_has_timestamp(self, project_report):
         """Test that HTML report includes timestamp."""
-        omni_runner.scan_for_executables()
+        content = project_report("python_simple_script", "html").content
         
-        output_file = temp_dir / "report.html"
-        omni_runner.generate_html_report(str(output_file))
-        
-        content = output_file.read_text()
-        
-        # Should contain some date/time information
-        assert "20" in content  # Years start with 20
+        # Should contain the generation date and time
+        assert _GENERATED_DATE_RE.search(content)
     
-    def test_json_report_timestamp_format(self, python_simple_script, omni_runner, temp_dir):
+    def test_json_report_timestamp_format(self, project_report):
         """Test that JSON report has ISO format timestamp."""
-        omni_runner.scan_for_executables()
-        
-        output_file = temp_dir / "report.json"
-        omni_runner.generate_json_report(str(output_file))
-        
-        data = json.loads(output_file.read_text())
+        data = project_report("python_simple_script", "json").data
         
-        # Should be ISO format
-        assert "T" in data["generated_at"]  # ISO format has T between date and time
-        assert "-" in data["generated_at"]  # ISO format has dashes
+        # Should parse as ISO 8601; fromisoformat raises ValueError otherwise
+        generated_at = datetime.fromisoformat(data["generated_at"])
+        assert generated_at <= datetime.now()
 